@@ -3,7 +3,9 @@
 from .roi import (
     # Core geometric functions
     point_in_polygon,
+    points_in_polygon,
     iou,
+    iou_matrix,
     
     # ROI filtering
     filter_boxes_by_roi,
@@ -25,7 +27,9 @@ from .roi import (
 __all__ = [
     # Core functions
     "point_in_polygon",
+    "points_in_polygon",
     "iou",
+    "iou_matrix",
     
     # ROI filtering
     "filter_boxes_by_roi",
@@ -5,39 +5,174 @@ Provides:
 - Point-in-polygon tests (ray casting algorithm)
 - IoU (Intersection over Union) calculations
 - ROI filtering for bounding boxes
-- Temporal buffering with deque
+- Temporal buffering with circular SoA arrays
 - Visualization utilities
 """
 
-from typing import List, Tuple, Optional, Union, Deque
-from collections import deque
+from typing import List, NamedTuple, Optional, Tuple, Union
 import numpy as np
 import cv2
 
+# Optional Numba JIT for the scalar point-in-polygon hot path (called per
+# detection per frame). Falls back to pure Python if numba isn't installed.
+try:
+    from numba import njit, prange  # type: ignore
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 
 # ============================================================================
 # Point-in-Polygon (Ray Casting Algorithm - Shapely-free)
 # ============================================================================
 
+def _pip_core(px: float, py: float, xs: np.ndarray, ys: np.ndarray) -> bool:
+    """Ray-cast crossing test over polygon vertex arrays (JIT-compiled if
+    numba is available). Same edge conditions as point_in_polygon."""
+    n = xs.shape[0]
+    inside = False
+    p1x = xs[0]
+    p1y = ys[0]
+    for i in range(1, n + 1):
+        p2x = xs[i % n]
+        p2y = ys[i % n]
+        if py > min(p1y, p2y):
+            if py <= max(p1y, p2y):
+                if px <= max(p1x, p2x):
+                    crosses = p1x == p2x
+                    if not crosses and p1y != p2y:
+                        xinters = (py - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                        crosses = px <= xinters
+                    if crosses:
+                        inside = not inside
+        p1x = p2x
+        p1y = p2y
+    return inside
+
+
+if _HAVE_NUMBA:
+    _pip_core = njit(cache=True, fastmath=True, boundscheck=False)(_pip_core)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _center_keep_kernel(cx, cy, xs, ys, keep):  # pragma: no cover - numba only
+        """Test each (cx, cy) center against one polygon across threads.
+
+        ORs results into keep, so already-kept boxes skip the ray cast.
+        """
+        for i in prange(cx.shape[0]):
+            if not keep[i]:
+                keep[i] = _pip_core(cx[i], cy[i], xs, ys)
+
+    # Warm the JIT at import so the first frame doesn't pay compile time
+    _pip_core(0.0, 0.0, np.zeros(3, dtype=np.float64), np.zeros(3, dtype=np.float64))
+    _center_keep_kernel(
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.float64),
+        np.zeros(3, dtype=np.float64),
+        np.zeros(3, dtype=np.float64),
+        np.zeros(1, dtype=np.bool_),
+    )
+
+class _CompiledPolygon(NamedTuple):
+    """Precomputed per-edge arrays for the ray cast (one entry per edge)."""
+    xs: np.ndarray        # edge start x
+    ys: np.ndarray        # edge start y
+    ymin: np.ndarray      # min(start y, end y)
+    ymax: np.ndarray      # max(start y, end y)
+    xmax: np.ndarray      # max(start x, end x)
+    slope: np.ndarray     # (dx / dy) per edge, 0 where the edge is horizontal
+    vertical: np.ndarray  # True where start x == end x
+    ex: np.ndarray        # edge vector x (end x - start x)
+    ey: np.ndarray        # edge vector y (end y - start y)
+    convex: bool          # edge turns share a sign and make one full turn
+
+
+# Small cache of polygon -> _CompiledPolygon so repeated calls against the
+# same ROI list don't redo vertex conversion and the per-edge division.
+# Keyed by id(); the polygon reference is kept alongside to pin the id.
+_POLY_CACHE: dict = {}
+_POLY_CACHE_MAX = 64
+
+
+def compile_polygon(polygon) -> _CompiledPolygon:
+    """
+    Precompute (and cache) per-edge arrays for a polygon.
+
+    Folding min/max bounds and the edge slope into arrays built once per
+    polygon removes the per-call division from the ray cast - queries
+    become compares plus one multiply-add against this table.
+    """
+    key = id(polygon)
+    cached = _POLY_CACHE.get(key)
+    if cached is not None and cached[0] is polygon:
+        return cached[1]
+
+    xs = np.asarray([p[0] for p in polygon], dtype=np.float64)
+    ys = np.asarray([p[1] for p in polygon], dtype=np.float64)
+    xs_next = np.roll(xs, -1)
+    ys_next = np.roll(ys, -1)
+
+    ex = xs_next - xs
+    ey = ys_next - ys
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(ey != 0, ex / np.where(ey != 0, ey, 1.0), 0.0)
+
+    # Convex iff all consecutive edge turns share a sign (zeros allowed
+    # for collinear vertices) AND the edges make exactly one full turn.
+    # The turning check rejects self-intersecting vertex orders such as a
+    # pentagram, whose turns all share a sign but wind around twice; those
+    # must take the crossing-number path to match point_in_polygon.
+    turns = ex * np.roll(ey, -1) - ey * np.roll(ex, -1)
+    convex = bool((turns >= 0).all() or (turns <= 0).all())
+    if convex:
+        dots = ex * np.roll(ex, -1) + ey * np.roll(ey, -1)
+        total_turning = abs(float(np.arctan2(turns, dots).sum()))
+        convex = abs(total_turning - 2.0 * np.pi) < 1e-6
+
+    compiled = _CompiledPolygon(
+        xs=xs,
+        ys=ys,
+        ymin=np.minimum(ys, ys_next),
+        ymax=np.maximum(ys, ys_next),
+        xmax=np.maximum(xs, xs_next),
+        slope=slope,
+        vertical=xs == xs_next,
+        ex=ex,
+        ey=ey,
+        convex=convex,
+    )
+
+    if len(_POLY_CACHE) >= _POLY_CACHE_MAX:
+        _POLY_CACHE.clear()
+    _POLY_CACHE[key] = (polygon, compiled)
+    return compiled
+
+
+def _polygon_arrays(polygon) -> Tuple[np.ndarray, np.ndarray]:
+    """Return cached (xs, ys) float64 vertex arrays for a polygon."""
+    compiled = compile_polygon(polygon)
+    return compiled.xs, compiled.ys
+
+
 def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
     """
     Check if a point is inside a polygon using ray casting algorithm.
-    
+
     Simple, Shapely-free implementation using basic math.
-    
+
     Algorithm:
         Cast a ray from the point to infinity (horizontally to the right).
         Count how many times the ray intersects polygon edges.
         If odd number of intersections → point is inside
         If even number of intersections → point is outside
-    
+
     Args:
         point: (x, y) coordinates (float or int)
         polygon: List of (x, y) vertices defining the polygon
-        
+
     Returns:
         True if point is inside polygon, False otherwise
-        
+
     Example:
         >>> polygon = [(0, 0), (100, 0), (100, 100), (0, 100)]  # Square
         >>> point_in_polygon((50, 50), polygon)
@@ -47,15 +182,22 @@ def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, floa
     """
     if not polygon or len(polygon) < 3:
         return False
-    
+
     x, y = point
+
+    # With numba available, the compiled core beats the interpreted loop;
+    # without it, array conversion overhead isn't worth it for one point.
+    if _HAVE_NUMBA:
+        xs, ys = _polygon_arrays(polygon)
+        return bool(_pip_core(float(x), float(y), xs, ys))
+
     n = len(polygon)
     inside = False
-    
+
     p1x, p1y = polygon[0]
     for i in range(1, n + 1):
         p2x, p2y = polygon[i % n]
-        
+
         # Check if point is on horizontal ray path
         if y > min(p1y, p2y):
             if y <= max(p1y, p2y):
@@ -63,16 +205,86 @@ def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, floa
                     # Calculate intersection point
                     if p1y != p2y:
                         xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    
+
                     # Toggle inside flag if ray crosses edge
                     if p1x == p2x or x <= xinters:
                         inside = not inside
-        
+
         p1x, p1y = p2x, p2y
-    
+
     return inside
 
 
+def points_in_polygon(
+    points: Union[np.ndarray, List[Tuple[float, float]]],
+    polygon: List[Tuple[float, float]],
+) -> np.ndarray:
+    """
+    Vectorized batch version of point_in_polygon.
+
+    Runs the same crossing-number ray cast as point_in_polygon, but for all
+    points against all polygon edges at once using NumPy broadcasting, so the
+    inner loop executes in C instead of the interpreter.
+
+    Args:
+        points: (N, 2) array (or list) of (x, y) coordinates; a single (x, y)
+                pair is also accepted
+        polygon: List of (x, y) vertices defining the polygon
+
+    Returns:
+        Boolean ndarray of shape (N,): True where the point is inside
+
+    Example:
+        >>> polygon = [(0, 0), (100, 0), (100, 100), (0, 100)]  # Square
+        >>> points_in_polygon([(50, 50), (150, 50)], polygon)
+        array([ True, False])
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    if pts.size == 0:
+        return np.zeros(0, dtype=bool)
+    if pts.ndim == 1:
+        pts = pts.reshape(1, 2)
+
+    if not polygon or len(polygon) < 3:
+        return np.zeros(len(pts), dtype=bool)
+
+    poly = compile_polygon(polygon)
+
+    px = pts[:, 0][:, None]
+    py = pts[:, 1][:, None]
+
+    if poly.convex:
+        # Convex fast path: inside iff every edge cross product shares a
+        # sign. Division-free - one FMA and a sign check per edge.
+        cross = poly.ex * (py - poly.ys) - poly.ey * (px - poly.xs)
+        inside = ~((cross > 0).any(axis=1) & (cross < 0).any(axis=1))
+
+        # Points exactly on an edge line produce a zero cross product; the
+        # ray cast has its own boundary convention, so defer those to it
+        ambiguous = (cross == 0).any(axis=1)
+        if ambiguous.any():
+            idx = np.nonzero(ambiguous)[0]
+            inside[idx] = _crossing_inside(px[idx], py[idx], poly)
+        return inside
+
+    return _crossing_inside(px, py, poly)
+
+
+def _crossing_inside(px: np.ndarray, py: np.ndarray, poly: _CompiledPolygon) -> np.ndarray:
+    """Crossing-number test for (N, 1) point columns against an edge table.
+
+    Same edge conditions as the scalar ray cast, evaluated for all
+    (point, edge) pairs at once. Horizontal edges never satisfy on_ray
+    (ymin == ymax), so their zeroed slope is never selected.
+    """
+    on_ray = (py > poly.ymin) & (py <= poly.ymax) & (px <= poly.xmax)
+    xinters = (py - poly.ys) * poly.slope + poly.xs
+    crosses = on_ray & (poly.vertical | (px <= xinters))
+
+    # Odd number of crossings -> inside
+    return (crosses.sum(axis=1) % 2).astype(bool)
+
+
 # ============================================================================
 # IoU (Intersection over Union) - Shapely-free
 # ============================================================================
@@ -121,10 +333,43 @@ def iou(box1: List[float], box2: List[float]) -> float:
     
     if union_area <= 0:
         return 0.0
-    
+
     return intersection_area / union_area
 
 
+def iou_matrix(
+    boxes_a: Union[np.ndarray, List[List[float]]],
+    boxes_b: Union[np.ndarray, List[List[float]]],
+) -> np.ndarray:
+    """
+    Compute pairwise IoU between two sets of bounding boxes.
+
+    Broadcasted version of iou(): one NumPy call replaces M*N Python-level
+    invocations, which is what TemporalBuffer.count_similar needs when
+    scanning a detection against the whole buffer.
+
+    Args:
+        boxes_a: (M, 4) array/list of [x1, y1, x2, y2] boxes
+        boxes_b: (N, 4) array/list of [x1, y1, x2, y2] boxes
+
+    Returns:
+        (M, N) float32 ndarray of IoU values in range [0.0, 1.0]
+    """
+    a = np.asarray(boxes_a, dtype=np.float32).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float32).reshape(-1, 4)
+
+    tl = np.maximum(a[:, None, :2], b[None, :, :2])
+    br = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    wh = np.clip(br - tl, 0, None)
+    inter = wh[..., 0] * wh[..., 1]
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
 # ============================================================================
 # ROI Filtering for Bounding Boxes
 # ============================================================================
@@ -174,59 +419,82 @@ def filter_boxes_by_roi(
     if mode not in valid_modes:
         raise ValueError(f"Invalid mode '{mode}'. Must be one of {valid_modes}")
     
+    # Mode: "center" - batch all box centers into one (N, 2) array and run
+    # the vectorized test once per ROI instead of once per box
+    if mode == "center":
+        if not boxes:
+            return []
+
+        bboxes = np.asarray([bbox for _, _, bbox in boxes], dtype=np.float64)
+        centers = np.column_stack((
+            (bboxes[:, 0] + bboxes[:, 2]) * 0.5,
+            (bboxes[:, 1] + bboxes[:, 3]) * 0.5,
+        ))
+
+        keep = np.zeros(len(boxes), dtype=bool)
+        if _HAVE_NUMBA:
+            # Boxes are independent, so the compiled kernel splits them
+            # across threads (prange) instead of broadcasting in one shot
+            cx = np.ascontiguousarray(centers[:, 0])
+            cy = np.ascontiguousarray(centers[:, 1])
+            for polygon in roi_polygons:
+                xs, ys = _polygon_arrays(polygon)
+                _center_keep_kernel(cx, cy, xs, ys, keep)
+        else:
+            for polygon in roi_polygons:
+                keep |= points_in_polygon(centers, polygon)
+
+        return [box for box, inside in zip(boxes, keep) if inside]
+
+    # Modes "any"/"all" - batch all 4 corners of every box into one
+    # (N, 4, 2) array and run the vectorized test per ROI, with an AABB
+    # pre-mask culling boxes that can't possibly match
+    if mode in ("any", "all"):
+        if not boxes:
+            return []
+
+        bboxes = np.asarray([bbox for _, _, bbox in boxes], dtype=np.float64)
+        x1, y1, x2, y2 = bboxes.T
+
+        # Corner order: top-left, top-right, bottom-left, bottom-right
+        corners = np.stack((
+            np.stack((x1, y1), axis=1),
+            np.stack((x2, y1), axis=1),
+            np.stack((x1, y2), axis=1),
+            np.stack((x2, y2), axis=1),
+        ), axis=1)
+
+        keep = np.zeros(len(boxes), dtype=bool)
+        for polygon in roi_polygons:
+            xs, ys = _polygon_arrays(polygon)
+            ax1, ay1 = xs.min(), ys.min()
+            ax2, ay2 = xs.max(), ys.max()
+
+            if mode == "any":
+                # A corner can only be inside if the box overlaps the AABB
+                cand = ~keep & ~((x2 < ax1) | (x1 > ax2) | (y2 < ay1) | (y1 > ay2))
+            else:
+                # All corners inside requires full containment in the AABB
+                cand = ~keep & (x1 >= ax1) & (y1 >= ay1) & (x2 <= ax2) & (y2 <= ay2)
+
+            if not cand.any():
+                continue
+
+            idx = np.nonzero(cand)[0]
+            inside = points_in_polygon(
+                corners[idx].reshape(-1, 2), polygon
+            ).reshape(-1, 4)
+            hits = inside.any(axis=1) if mode == "any" else inside.all(axis=1)
+            keep[idx[hits]] = True
+
+        return [box for box, inside in zip(boxes, keep) if inside]
+
+    # Mode: "overlap" - check bbox-ROI overlap ratio
     filtered = []
-    
     for label, conf, bbox in boxes:
-        x1, y1, x2, y2 = bbox
-        
-        # Mode: "center" - check if bbox center is in any ROI
-        if mode == "center":
-            center_x = (x1 + x2) / 2
-            center_y = (y1 + y2) / 2
-            center = (center_x, center_y)
-            
-            # Check if center is in any ROI polygon
-            in_roi = any(
-                point_in_polygon(center, polygon)
-                for polygon in roi_polygons
-            )
-            
-            if in_roi:
-                filtered.append((label, conf, bbox))
-        
-        # Mode: "any" - check if any corner is in any ROI
-        elif mode == "any":
-            corners = [
-                (x1, y1),  # Top-left
-                (x2, y1),  # Top-right
-                (x1, y2),  # Bottom-left
-                (x2, y2),  # Bottom-right
-            ]
-            
-            in_roi = any(
-                point_in_polygon(corner, polygon)
-                for polygon in roi_polygons
-                for corner in corners
-            )
-            
-            if in_roi:
-                filtered.append((label, conf, bbox))
-        
-        # Mode: "all" - check if all corners are in the same ROI
-        elif mode == "all":
-            corners = [(x1, y1), (x2, y1), (x1, y2), (x2, y2)]
-            
-            # Check each ROI polygon
-            for polygon in roi_polygons:
-                if all(point_in_polygon(corner, polygon) for corner in corners):
-                    filtered.append((label, conf, bbox))
-                    break
-        
-        # Mode: "overlap" - check bbox-ROI overlap ratio
-        elif mode == "overlap":
-            if bbox_overlaps_roi(bbox, roi_polygons, threshold=min_overlap):
-                filtered.append((label, conf, bbox))
-    
+        if bbox_overlaps_roi(bbox, roi_polygons, threshold=min_overlap):
+            filtered.append((label, conf, bbox))
+
     return filtered
 
 
@@ -294,32 +562,46 @@ def bbox_overlaps_roi(
 
 class TemporalBuffer:
     """
-    Temporal buffer for tracking detections over time using deque.
-    
+    Temporal buffer for tracking detections over time.
+
     Maintains a sliding window of recent detections with configurable size.
     Useful for temporal smoothing and confirmation logic.
-    
+
+    Internally stores detections structure-of-arrays style: fixed-capacity
+    circular NumPy arrays for boxes/confidences/frames plus interned label
+    ids, so count_similar can scan the whole window with one vectorized
+    IoU call instead of walking Python tuples.
+
     Example:
         >>> buffer = TemporalBuffer(maxlen=10)
         >>> buffer.add("weapon", [100, 100, 200, 200], 0.9, frame_idx=1)
         >>> buffer.add("weapon", [102, 98, 202, 198], 0.88, frame_idx=2)
-        >>> 
+        >>>
         >>> # Check if detection is confirmed (appears N times)
         >>> if buffer.count_similar("weapon", [101, 99, 201, 199], iou_threshold=0.5) >= 3:
         ...     print("Detection confirmed!")
     """
-    
+
     def __init__(self, maxlen: int = 30):
         """
         Initialize temporal buffer.
-        
+
         Args:
             maxlen: Maximum buffer size (oldest items auto-removed)
         """
         self.maxlen = maxlen
-        self.buffer: Deque[Tuple[str, List[float], float, int]] = deque(maxlen=maxlen)
+        # Parallel circular buffers (float64 so coordinates and confidences
+        # round-trip exactly through get_recent)
+        self._boxes = np.empty((maxlen, 4), dtype=np.float64)
+        self._confs = np.empty(maxlen, dtype=np.float64)
+        self._frames = np.empty(maxlen, dtype=np.int64)
+        self._label_ids = np.empty(maxlen, dtype=np.int32)
+        self._lid: dict = {}      # label -> interned id
+        self._labels: List[str] = []  # interned id -> label
+        self._head = 0            # next write slot
+        self._size = 0
         self._frame_counter = 0
-    
+
     def add(
         self,
         label: str,
@@ -329,7 +611,7 @@ class TemporalBuffer:
     ) -> None:
         """
         Add detection to buffer.
-        
+
         Args:
             label: Detection class label
             bbox: Bounding box [x1, y1, x2, y2]
@@ -339,9 +621,26 @@ class TemporalBuffer:
         if frame_idx is None:
             frame_idx = self._frame_counter
             self._frame_counter += 1
-        
-        self.buffer.append((label, bbox, confidence, frame_idx))
-    
+
+        # deque(maxlen=0) semantics: accept the detection but keep nothing
+        if self.maxlen == 0:
+            return
+
+        lid = self._lid.get(label)
+        if lid is None:
+            lid = len(self._labels)
+            self._lid[label] = lid
+            self._labels.append(label)
+
+        i = self._head
+        self._boxes[i] = bbox
+        self._confs[i] = confidence
+        self._frames[i] = frame_idx
+        self._label_ids[i] = lid
+        self._head = (i + 1) % self.maxlen
+        if self._size < self.maxlen:
+            self._size += 1
+
     def count_similar(
         self,
         label: str,
@@ -350,51 +649,99 @@ class TemporalBuffer:
     ) -> int:
         """
         Count how many times a similar detection appears in buffer.
-        
+
         Args:
             label: Detection label to match
             bbox: Bounding box to compare [x1, y1, x2, y2]
             iou_threshold: Minimum IoU to consider detections similar
-            
+
         Returns:
             Count of similar detections
         """
-        count = 0
-        
-        for buf_label, buf_bbox, _, _ in self.buffer:
-            if buf_label != label:
-                continue
-            
-            overlap = iou(bbox, buf_bbox)
-            if overlap >= iou_threshold:
-                count += 1
-        
-        return count
-    
+        lid = self._lid.get(label)
+        if lid is None or self._size == 0:
+            return 0
+
+        # Order doesn't matter for counting, so scan the valid slots directly
+        mask = self._label_ids[: self._size] == lid
+        if not mask.any():
+            return 0
+
+        ious = iou_matrix([bbox], self._boxes[: self._size][mask])[0]
+        return int((ious >= iou_threshold).sum())
+
+    def add_and_count(
+        self,
+        label: str,
+        bbox: List[float],
+        confidence: float,
+        iou_threshold: float = 0.5,
+        frame_idx: Optional[int] = None,
+    ) -> int:
+        """
+        Add detection to buffer and count similar detections in one pass.
+
+        Fuses count_similar + add so the buffer is scanned once per frame:
+        the IoU sweep runs against the pre-add history, then the detection
+        is appended. The returned count includes the new detection.
+
+        Args:
+            label: Detection class label
+            bbox: Bounding box [x1, y1, x2, y2]
+            confidence: Confidence score (0.0-1.0)
+            iou_threshold: Minimum IoU to consider detections similar
+            frame_idx: Optional frame index (auto-increments if None)
+
+        Returns:
+            Count of similar detections, including the one just added
+        """
+        count = self.count_similar(label, bbox, iou_threshold)
+        self.add(label, bbox, confidence, frame_idx)
+        return count + 1
+
     def get_recent(self, n: int = 5) -> List[Tuple[str, List[float], float, int]]:
         """
         Get N most recent detections.
-        
+
         Args:
             n: Number of recent items to return
-            
+
         Returns:
             List of (label, bbox, confidence, frame_idx) tuples
         """
-        return list(self.buffer)[-n:]
-    
+        if self._size == 0:
+            return []
+
+        n = min(n, self._size)
+        # _head is one past the newest entry; walk back n slots (ring-aware)
+        start = (self._head - n) % self.maxlen
+        indices = (start + np.arange(n)) % self.maxlen
+
+        return [
+            (
+                self._labels[self._label_ids[i]],
+                self._boxes[i].tolist(),
+                float(self._confs[i]),
+                int(self._frames[i]),
+            )
+            for i in indices
+        ]
+
     def clear(self) -> None:
         """Clear buffer."""
-        self.buffer.clear()
+        self._head = 0
+        self._size = 0
+        self._lid.clear()
+        self._labels.clear()
         self._frame_counter = 0
-    
+
     def size(self) -> int:
         """Get current buffer size."""
-        return len(self.buffer)
-    
+        return self._size
+
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
-        return len(self.buffer) == 0
+        return self._size == 0
 
 
 def temporal_confirm(
@@ -439,15 +786,12 @@ def temporal_confirm(
         >>> confirmed = temporal_confirm(buffer, "weapon", [101, 99, 201, 199], 0.91, min_confirmations=3)
         >>> # confirmed = True (3 similar detections!)
     """
-    # Check confirmation BEFORE adding (check against existing history)
-    count = buffer.count_similar(label, bbox, iou_threshold)
-    
-    # Add current detection to buffer
-    buffer.add(label, bbox, confidence, frame_idx)
-    
-    # Return True if we have enough confirmations
-    # Note: count is checked BEFORE adding, so we compare with min_confirmations - 1
-    return count >= (min_confirmations - 1)
+    # Single fused pass: IoU sweep against existing history, then append.
+    # The returned count includes the current detection, so comparing with
+    # min_confirmations matches the old "count-before-add >= min - 1" logic.
+    count = buffer.add_and_count(label, bbox, confidence, iou_threshold, frame_idx)
+
+    return count >= min_confirmations
 
 
 # ============================================================================
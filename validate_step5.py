@@ -15,10 +15,40 @@ Run:
     python3 validate_step5.py
 """
 
+import argparse
 import sys
 import os
+import mmap
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Optional JIT-compiled newline counter for very large files. Numba is not a
+# project dependency; the chunked bytes.count() loop below is the fallback.
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _count_nl(buf) -> int:
+        count = 0
+        for i in range(buf.size):
+            count += buf[i] == 10  # b'\n'
+        return count
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Below this size the chunked loop wins; JIT dispatch overhead only pays off
+# on very large inputs (e.g. generated client stubs).
+_JIT_COUNT_MIN_BYTES = 64 << 20
+
+
+# When False (default), validators stop at the first hard failure (missing
+# file, missing class) instead of running the remaining scans that are
+# guaranteed to fail anyway. --continue-on-error restores "show all failures".
+CONTINUE_ON_ERROR = False
 
 
 # ANSI color codes
@@ -56,31 +86,243 @@ def print_info(text: str):
     print(f"  {text}")
 
 
+@dataclass(frozen=True)
+class Probe:
+    """A substring probe against publisher source content."""
+
+    needles: Tuple[str, ...]  # Any match counts (alternative spellings)
+    found_msg: str
+    missing_msg: str
+    required: bool = True  # Optional probes only warn when missing
+    lowercase: bool = False  # Match against lowercased content
+
+
+@dataclass(frozen=True)
+class PublisherSpec:
+    """Declarative description of one publisher's validation checks."""
+
+    label: str
+    path: Path
+    class_name: str
+    min_lines: int
+    methods: Tuple[str, ...]
+    imports: Tuple[str, ...]
+    probes: Tuple[Probe, ...]
+
+
+PUBLISHERS: List[PublisherSpec] = [
+    PublisherSpec(
+        label="KDS Publisher",
+        path=Path("src/kvs_infer/publisher/kds.py"),
+        class_name="KDSClient",
+        min_lines=350,
+        methods=(
+            "__init__",
+            "put_event",
+            "put_events",
+            "flush",
+            "_send_batch_with_retries",
+            "_create_event_envelope",
+            "_generate_event_id",
+            "get_metrics",
+        ),
+        imports=(
+            "import boto3",
+            "import json",
+            "import hashlib",
+            "from botocore.exceptions import ClientError",
+        ),
+        probes=(
+            Probe(
+                ("put_records",),
+                "PutRecords API found (batching support)",
+                "PutRecords API not found (batching)",
+                lowercase=True,
+            ),
+            Probe(
+                ("ProvisionedThroughputExceededException",),
+                "Throttling exception handling found",
+                "Throttling exception handling not found",
+            ),
+            Probe(
+                ("2 ** attempt", "2**attempt"),
+                "Exponential backoff found",
+                "Exponential backoff not found",
+            ),
+            Probe(
+                ("random.uniform",),
+                "Jitter randomization found",
+                "Jitter randomization not found (optional)",
+                required=False,
+            ),
+            Probe(
+                ("hashlib.sha1",),
+                "SHA1 event_id generation found",
+                "SHA1 event_id generation not found",
+            ),
+            Probe(
+                ("self.metrics",),
+                "Metrics tracking found",
+                "Metrics tracking not found",
+            ),
+        ),
+    ),
+    PublisherSpec(
+        label="S3 Publisher",
+        path=Path("src/kvs_infer/publisher/s3.py"),
+        class_name="S3Snapshot",
+        min_lines=250,
+        methods=(
+            "__init__",
+            "save",
+            "save_with_bbox",
+            "get_url",
+            "_generate_key",
+            "get_metrics",
+        ),
+        imports=(
+            "import boto3",
+            "import cv2",
+            "from botocore.exceptions import ClientError",
+        ),
+        probes=(
+            Probe(
+                ("cv2.imencode",),
+                "cv2.imencode (JPEG encoding) found",
+                "cv2.imencode (JPEG encoding) not found",
+            ),
+            Probe(
+                ("IMWRITE_JPEG_QUALITY",),
+                "JPEG quality parameter found",
+                "JPEG quality parameter not found",
+            ),
+            Probe(
+                ("put_object",),
+                "S3 put_object found",
+                "S3 put_object not found",
+            ),
+            Probe(
+                ("generate_presigned_url",),
+                "Presigned URL generation found",
+                "Presigned URL generation not found (optional)",
+                required=False,
+            ),
+            Probe(
+                ("cv2.rectangle",),
+                "Bbox drawing found",
+                "Bbox drawing not found (optional)",
+                required=False,
+            ),
+            Probe(
+                ("self.metrics",),
+                "Metrics tracking found",
+                "Metrics tracking not found",
+            ),
+        ),
+    ),
+    PublisherSpec(
+        label="DynamoDB Publisher",
+        path=Path("src/kvs_infer/publisher/ddb.py"),
+        class_name="DDBWriter",
+        min_lines=300,
+        methods=(
+            "__init__",
+            "put_event",
+            "put_events",
+            "_prepare_item",
+            "get_metrics",
+        ),
+        imports=(
+            "import boto3",
+            "from decimal import Decimal",
+            "from botocore.exceptions import ClientError",
+        ),
+        probes=(
+            Probe(
+                ("Decimal",),
+                "Decimal conversion found",
+                "Decimal conversion not found (DynamoDB requirement)",
+            ),
+            Probe(
+                ("batch_writer",),
+                "Batch writer found",
+                "Batch writer not found (optional)",
+                required=False,
+            ),
+            Probe(
+                ("ttl",),
+                "TTL support found",
+                "TTL support not found (optional)",
+                required=False,
+            ),
+            Probe(
+                ("self.metrics",),
+                "Metrics tracking found",
+                "Metrics tracking not found",
+            ),
+        ),
+    ),
+]
+
+
+def count_lines(filepath: Path) -> int:
+    """
+    Count lines in a file by scanning fixed-size byte chunks.
+
+    Reads 1 MiB blocks with buffering disabled and counts newlines with
+    bytes.count(), which runs as a vectorized C loop, instead of iterating
+    the file line by line in Python.
+    """
+    count = 0
+    with open(filepath, 'rb', buffering=0) as f:
+        if _HAVE_NUMBA and os.fstat(f.fileno()).st_size >= _JIT_COUNT_MIN_BYTES:
+            # mmap the file and hand a uint8 view to the JIT kernel; the loop
+            # auto-vectorizes and releases the GIL.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return int(_count_nl(np.frombuffer(mm, dtype=np.uint8)))
+
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b'\n')
+    return count
+
+
+def hard_fail(passed: bool) -> bool:
+    """Return True when a failed check should abort the remaining checks."""
+    return not passed and not CONTINUE_ON_ERROR
+
+
 def validate_file_exists(filepath: Path, min_lines: int = 100) -> bool:
     """
     Validate that file exists and has minimum lines.
-    
+
     Args:
         filepath: Path to file
         min_lines: Minimum line count
-        
+
     Returns:
         True if valid
     """
-    if not filepath.exists():
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
         print_error(f"File not found: {filepath}")
         return False
-    
+
+    # Cheap size gate: a file well above ~200 bytes/line cannot be under the
+    # line threshold, so accept it without reading the content at all.
+    if st.st_size > min_lines * 200:
+        print_success(f"File exists: {filepath.name} (> {min_lines} lines)")
+        return True
+
     # Check line count
-    with open(filepath, 'r') as f:
-        line_count = len(f.readlines())
-    
+    line_count = count_lines(filepath)
+
     if line_count < min_lines:
         print_error(
             f"File too short: {filepath} ({line_count} lines, expected >= {min_lines})"
         )
         return False
-    
+
     print_success(f"File exists: {filepath.name} ({line_count} lines)")
     return True
 
@@ -88,419 +330,238 @@ def validate_file_exists(filepath: Path, min_lines: int = 100) -> bool:
 def validate_class_exists(filepath: Path, class_name: str) -> bool:
     """
     Validate that class is defined in file.
-    
+
     Args:
         filepath: Path to file
         class_name: Class name to find
-        
+
     Returns:
         True if found
     """
     with open(filepath, 'r') as f:
         content = f.read()
-    
+
     if f"class {class_name}" not in content:
         print_error(f"Class not found: {class_name} in {filepath.name}")
         return False
-    
+
     print_success(f"Class exists: {class_name}")
     return True
 
 
-def validate_methods(filepath: Path, class_name: str, methods: List[str]) -> bool:
+def validate_methods(filepath: Path, class_name: str, methods: Tuple[str, ...]) -> bool:
     """
     Validate that methods exist in class.
-    
+
     Args:
         filepath: Path to file
         class_name: Class name
-        methods: List of method names
-        
+        methods: Method names to find
+
     Returns:
         True if all found
     """
     with open(filepath, 'r') as f:
         content = f.read()
-    
+
     all_found = True
     for method in methods:
         if f"def {method}" not in content:
             print_error(f"Method not found: {class_name}.{method}()")
             all_found = False
-    
+
     if all_found:
         print_success(f"All methods exist in {class_name}: {', '.join(methods)}")
-    
+
     return all_found
 
 
-def validate_imports(filepath: Path, required_imports: List[str]) -> bool:
+def validate_imports(filepath: Path, required_imports: Tuple[str, ...]) -> bool:
     """
     Validate that required imports exist.
-    
+
     Args:
         filepath: Path to file
-        required_imports: List of import strings to find
-        
+        required_imports: Import strings to find
+
     Returns:
         True if all found
     """
     with open(filepath, 'r') as f:
         content = f.read()
-    
+
     all_found = True
     for import_str in required_imports:
         if import_str not in content:
             print_error(f"Import not found: {import_str} in {filepath.name}")
             all_found = False
-    
+
     if all_found:
         print_success(f"All required imports exist in {filepath.name}")
-    
+
     return all_found
 
 
-def validate_kds_publisher() -> bool:
-    """Validate KDS publisher implementation."""
-    print_header("Validating KDS Publisher (kds.py)")
-    
-    filepath = Path("src/kvs_infer/publisher/kds.py")
-    
+def validate_publisher(spec: PublisherSpec) -> bool:
+    """Validate one publisher implementation against its spec."""
+    print_header(f"Validating {spec.label} ({spec.path.name})")
+
     checks = []
-    
-    # Check file exists
-    checks.append(validate_file_exists(filepath, min_lines=350))
-    
-    # Check class exists
-    checks.append(validate_class_exists(filepath, "KDSClient"))
-    
-    # Check required methods
-    required_methods = [
-        "__init__",
-        "put_event",
-        "put_events",
-        "flush",
-        "_send_batch_with_retries",
-        "_create_event_envelope",
-        "_generate_event_id",
-        "get_metrics",
-    ]
-    checks.append(validate_methods(filepath, "KDSClient", required_methods))
-    
-    # Check required imports
-    required_imports = [
-        "import boto3",
-        "import json",
-        "import hashlib",
-        "from botocore.exceptions import ClientError",
-    ]
-    checks.append(validate_imports(filepath, required_imports))
-    
-    # Check for batching logic
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    if "put_records" not in content.lower():
-        print_error("PutRecords API not found (batching)")
-        checks.append(False)
-    else:
-        print_success("PutRecords API found (batching support)")
-        checks.append(True)
-    
-    # Check for retry logic
-    if "ProvisionedThroughputExceededException" not in content:
-        print_error("Throttling exception handling not found")
-        checks.append(False)
-    else:
-        print_success("Throttling exception handling found")
-        checks.append(True)
-    
-    # Check for exponential backoff
-    if "2 ** attempt" not in content and "2**attempt" not in content:
-        print_error("Exponential backoff not found")
-        checks.append(False)
-    else:
-        print_success("Exponential backoff found")
-        checks.append(True)
-    
-    # Check for jitter
-    if "random.uniform" not in content:
-        print_warning("Jitter randomization not found (optional)")
-    else:
-        print_success("Jitter randomization found")
-    
-    # Check for event_id generation
-    if "hashlib.sha1" not in content:
-        print_error("SHA1 event_id generation not found")
-        checks.append(False)
-    else:
-        print_success("SHA1 event_id generation found")
-        checks.append(True)
-    
-    # Check for metrics
-    if "self.metrics" not in content:
-        print_error("Metrics tracking not found")
-        checks.append(False)
-    else:
-        print_success("Metrics tracking found")
-        checks.append(True)
-    
-    return all(checks)
 
+    # Check file exists (hard prerequisite for every check below)
+    checks.append(validate_file_exists(spec.path, min_lines=spec.min_lines))
+    if hard_fail(checks[-1]):
+        return False
 
-def validate_s3_publisher() -> bool:
-    """Validate S3 publisher implementation."""
-    print_header("Validating S3 Publisher (s3.py)")
-    
-    filepath = Path("src/kvs_infer/publisher/s3.py")
-    
-    checks = []
-    
-    # Check file exists
-    checks.append(validate_file_exists(filepath, min_lines=250))
-    
-    # Check class exists
-    checks.append(validate_class_exists(filepath, "S3Snapshot"))
-    
-    # Check required methods
-    required_methods = [
-        "__init__",
-        "save",
-        "save_with_bbox",
-        "get_url",
-        "_generate_key",
-        "get_metrics",
-    ]
-    checks.append(validate_methods(filepath, "S3Snapshot", required_methods))
-    
-    # Check required imports
-    required_imports = [
-        "import boto3",
-        "import cv2",
-        "from botocore.exceptions import ClientError",
-    ]
-    checks.append(validate_imports(filepath, required_imports))
-    
-    # Check for JPEG encoding
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    if "cv2.imencode" not in content:
-        print_error("cv2.imencode (JPEG encoding) not found")
-        checks.append(False)
-    else:
-        print_success("cv2.imencode (JPEG encoding) found")
-        checks.append(True)
-    
-    # Check for JPEG quality
-    if "IMWRITE_JPEG_QUALITY" not in content:
-        print_error("JPEG quality parameter not found")
-        checks.append(False)
-    else:
-        print_success("JPEG quality parameter found")
-        checks.append(True)
-    
-    # Check for put_object
-    if "put_object" not in content:
-        print_error("S3 put_object not found")
-        checks.append(False)
-    else:
-        print_success("S3 put_object found")
-        checks.append(True)
-    
-    # Check for presigned URL
-    if "generate_presigned_url" not in content:
-        print_warning("Presigned URL generation not found (optional)")
-    else:
-        print_success("Presigned URL generation found")
-    
-    # Check for bbox drawing
-    if "cv2.rectangle" not in content:
-        print_warning("Bbox drawing not found (optional)")
-    else:
-        print_success("Bbox drawing found")
-    
-    # Check for metrics
-    if "self.metrics" not in content:
-        print_error("Metrics tracking not found")
-        checks.append(False)
-    else:
-        print_success("Metrics tracking found")
-        checks.append(True)
-    
-    return all(checks)
+    # Check class exists (hard prerequisite for method checks)
+    checks.append(validate_class_exists(spec.path, spec.class_name))
+    if hard_fail(checks[-1]):
+        return False
 
+    # Check required methods and imports
+    checks.append(validate_methods(spec.path, spec.class_name, spec.methods))
+    checks.append(validate_imports(spec.path, spec.imports))
 
-def validate_ddb_publisher() -> bool:
-    """Validate DynamoDB publisher implementation."""
-    print_header("Validating DynamoDB Publisher (ddb.py)")
-    
-    filepath = Path("src/kvs_infer/publisher/ddb.py")
-    
-    checks = []
-    
-    # Check file exists
-    checks.append(validate_file_exists(filepath, min_lines=300))
-    
-    # Check class exists
-    checks.append(validate_class_exists(filepath, "DDBWriter"))
-    
-    # Check required methods
-    required_methods = [
-        "__init__",
-        "put_event",
-        "put_events",
-        "_prepare_item",
-        "get_metrics",
-    ]
-    checks.append(validate_methods(filepath, "DDBWriter", required_methods))
-    
-    # Check required imports
-    required_imports = [
-        "import boto3",
-        "from decimal import Decimal",
-        "from botocore.exceptions import ClientError",
-    ]
-    checks.append(validate_imports(filepath, required_imports))
-    
-    # Check for Decimal conversion
-    with open(filepath, 'r') as f:
+    # Run content probes
+    with open(spec.path, 'r') as f:
         content = f.read()
-    
-    if "Decimal" not in content:
-        print_error("Decimal conversion not found (DynamoDB requirement)")
-        checks.append(False)
-    else:
-        print_success("Decimal conversion found")
-        checks.append(True)
-    
-    # Check for batch writing
-    if "batch_writer" not in content:
-        print_warning("Batch writer not found (optional)")
-    else:
-        print_success("Batch writer found")
-    
-    # Check for TTL support
-    if "ttl" in content:
-        print_success("TTL support found")
-    else:
-        print_warning("TTL support not found (optional)")
-    
-    # Check for metrics
-    if "self.metrics" not in content:
-        print_error("Metrics tracking not found")
-        checks.append(False)
-    else:
-        print_success("Metrics tracking found")
-        checks.append(True)
-    
+    content_lower = content.lower()
+
+    for probe in spec.probes:
+        haystack = content_lower if probe.lowercase else content
+        found = any(needle in haystack for needle in probe.needles)
+
+        if found:
+            print_success(probe.found_msg)
+        elif probe.required:
+            print_error(probe.missing_msg)
+        else:
+            print_warning(probe.missing_msg)
+
+        if probe.required:
+            checks.append(found)
+
     return all(checks)
 
 
 def validate_publisher_init() -> bool:
     """Validate publisher __init__.py exports."""
     print_header("Validating Publisher Module (__init__.py)")
-    
+
     filepath = Path("src/kvs_infer/publisher/__init__.py")
-    
+
     checks = []
-    
+
     # Check file exists
     if not filepath.exists():
         print_error(f"File not found: {filepath}")
         return False
-    
+
     print_success(f"File exists: {filepath.name}")
-    
+
     # Check exports
     with open(filepath, 'r') as f:
         content = f.read()
-    
+
     required_exports = [
         "from kvs_infer.publisher.kds import KDSClient",
         "from kvs_infer.publisher.s3 import S3Snapshot",
         "from kvs_infer.publisher.ddb import DDBWriter",
     ]
-    
+
     for export in required_exports:
         if export not in content:
             print_error(f"Export not found: {export}")
             checks.append(False)
         else:
             checks.append(True)
-    
+
     if all(checks):
         print_success("All publishers exported in __init__.py")
-    
+
     return all(checks)
 
 
 def validate_event_envelope_format() -> bool:
     """Validate event envelope format consistency."""
     print_header("Validating Event Envelope Format")
-    
+
     checks = []
-    
+
     # Check KDS creates proper envelope
     kds_path = Path("src/kvs_infer/publisher/kds.py")
     with open(kds_path, 'r') as f:
         kds_content = f.read()
-    
+
     required_fields = ["event_id", "camera_id", "producer", "payload"]
-    
+
     for field in required_fields:
         if f'"{field}"' not in kds_content and f"'{field}'" not in kds_content:
             print_error(f"Event envelope field missing: {field}")
             checks.append(False)
         else:
             checks.append(True)
-    
+
     if all(checks):
         print_success("Event envelope format correct in kds.py")
-    
+
     # Check DDB handles envelope
     ddb_path = Path("src/kvs_infer/publisher/ddb.py")
     with open(ddb_path, 'r') as f:
         ddb_content = f.read()
-    
+
     if 'event["event_id"]' in ddb_content and 'event["payload"]' in ddb_content:
         print_success("Event envelope handling correct in ddb.py")
     else:
         print_error("Event envelope handling incorrect in ddb.py")
         checks.append(False)
-    
+
     return all(checks)
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments."""
+    parser = argparse.ArgumentParser(description="Validate Step 5 publisher implementations")
+    parser.add_argument(
+        "--continue-on-error",
+        action="store_true",
+        help="Run every check even after a hard failure (show all failures)",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Run all validation checks."""
+    global CONTINUE_ON_ERROR
+    args = parse_args()
+    CONTINUE_ON_ERROR = args.continue_on_error
+
     print_header("Step 5 Publisher Implementation Validation")
-    
+
     print_info("Validating publisher implementations...")
     print_info("Checking: KDS, S3, DynamoDB publishers")
     print_info("")
-    
+
     results = []
-    
+
     # Validate individual publishers
-    results.append(("KDS Publisher", validate_kds_publisher()))
-    results.append(("S3 Publisher", validate_s3_publisher()))
-    results.append(("DynamoDB Publisher", validate_ddb_publisher()))
+    for spec in PUBLISHERS:
+        results.append((spec.label, validate_publisher(spec)))
     results.append(("Publisher Module", validate_publisher_init()))
     results.append(("Event Envelope Format", validate_event_envelope_format()))
-    
+
     # Print summary
     print_header("Validation Summary")
-    
+
     passed = sum(1 for _, result in results if result)
     total = len(results)
-    
+
     for name, result in results:
         if result:
             print_success(f"{name}: PASSED")
         else:
             print_error(f"{name}: FAILED")
-    
+
     print(f"\n{BLUE}{'=' * 80}{RESET}")
     if passed == total:
         print(f"{GREEN}✓ All checks passed ({passed}/{total}){RESET}")
@@ -19,7 +19,129 @@ Run:
 
 import sys
 import os
+import io
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class Check:
+    """One needle test with its success/failure messages."""
+
+    needles: Tuple[str, ...]  # "any" semantics unless require_all is set
+    found_msg: str
+    missing_msg: str
+    require_all: bool = False
+
+
+@dataclass(frozen=True)
+class Section:
+    """A named group of checks (one validator's worth)."""
+
+    name: str
+    checks: Tuple[Check, ...]
+
+# app.py is scanned by almost every validator; read it exactly once in main()
+# and let validators work on the shared string instead of re-opening the file.
+APP_PATH = Path("src/kvs_infer/app.py")
+APP_CONTENT = ""
+APP_LINES = 0
+
+# Every literal the content validators probe for. All of them are located in
+# ONE linear sweep over APP_CONTENT (instead of one full-file scan per
+# needle); validators then test set membership in FOUND.
+NEEDLES = (
+    # CLI
+    "ArgumentParser",
+    "--config",
+    "--http",
+    # Worker management
+    "def start(self):",
+    "self.thread = threading.Thread",
+    "def stop(self):",
+    "self.running = False",
+    "_initialize_detectors",
+    "_initialize_frame_source",
+    # FastAPI (both quote spellings of each endpoint decorator are needles in
+    # the same sweep, so the dual-quote check costs no extra scan)
+    "app = FastAPI",
+    '@app.get("/healthz")',
+    "@app.get('/healthz')",
+    '@app.get("/metrics")',
+    "@app.get('/metrics')",
+    "uvicorn.run",
+    # Prometheus
+    "infer_frames_total",
+    "infer_events_total",
+    "infer_latency_ms",
+    "publisher_failures_total",
+    "worker_alive",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    # Signals
+    "signal.signal",
+    "SIGTERM",
+    "SIGINT",
+    "def shutdown",
+    # Publishers
+    "initialize_publishers",
+    "KDSClient",
+    "S3Snapshot",
+    "DDBWriter",
+    "flush()",
+    # JSON logging
+    "class JSONFormatter",
+    "json.dumps",
+    "LOG_LEVEL",
+)
+FOUND = frozenset()
+
+# Import strings required in app.py; found with one compiled-alternation scan
+# instead of one substring pass per entry.
+REQUIRED_IMPORTS = (
+    "import argparse",
+    "import logging",
+    "import signal",
+    "import threading",
+    "from fastapi import FastAPI",
+    "from prometheus_client import",
+    "import uvicorn",
+    "from kvs_infer.config import load_config",
+    "from kvs_infer.frame_source.kvs_hls import KVSHLSFrameSource",
+    "from kvs_infer.detectors import DetectorRegistry",
+    "from kvs_infer.publisher import KDSClient, S3Snapshot, DDBWriter",
+)
+_IMPORTS_RE = re.compile(
+    "|".join(re.escape(s) for s in sorted(REQUIRED_IMPORTS, key=len, reverse=True))
+)
+
+try:
+    import ahocorasick
+
+    def sweep(content: str, needles: tuple) -> frozenset:
+        """Find all needles in one Aho-Corasick pass over content."""
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        return frozenset(needle for _, needle in automaton.iter(content))
+
+except ImportError:
+
+    def sweep(content: str, needles: tuple) -> frozenset:
+        """Find all needles in one compiled-alternation pass over content."""
+        # Longest-first so a needle nested in a longer one still wins where
+        # they share a position.
+        pattern = re.compile(
+            "|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True))
+        )
+        return frozenset(pattern.findall(content))
 
 # ANSI color codes
 GREEN = "\033[92m"
@@ -28,43 +150,92 @@ YELLOW = "\033[93m"
 BLUE = "\033[94m"
 RESET = "\033[0m"
 
+# Separator line built once instead of on every header call
+_SEP_LINE = f"{BLUE}{'=' * 80}{RESET}"
+
+
+# Validators run on worker threads; each thread writes into its own buffer so
+# output stays contiguous, and main() flushes the buffers in submission order.
+_OUTPUT = threading.local()
+
+
+def _out(line: str):
+    """Write a line to the current thread's buffer, or stdout on the main thread."""
+    buf = getattr(_OUTPUT, "buffer", None)
+    (buf.write if buf is not None else sys.stdout.write)(line + "\n")
+
 
 def print_header(text: str):
     """Print section header."""
-    print(f"\n{BLUE}{'=' * 80}{RESET}")
-    print(f"{BLUE}{text}{RESET}")
-    print(f"{BLUE}{'=' * 80}{RESET}\n")
+    _out(f"\n{_SEP_LINE}")
+    _out(f"{BLUE}{text}{RESET}")
+    _out(f"{_SEP_LINE}\n")
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{GREEN}✓ {text}{RESET}")
+    _out(f"{GREEN}✓ {text}{RESET}")
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"{RED}✗ {text}{RESET}")
+    _out(f"{RED}✗ {text}{RESET}")
 
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"{YELLOW}⚠ {text}{RESET}")
+    _out(f"{YELLOW}⚠ {text}{RESET}")
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"  {text}")
+    _out(f"  {text}")
+
+
+def report(passed: bool, found_msg: str, missing_msg: str) -> bool:
+    """Print the outcome of one check and pass its result through."""
+    if passed:
+        print_success(found_msg)
+    else:
+        print_error(missing_msg)
+    return passed
+
+
+def run_validator(check_func) -> tuple:
+    """Run one validator with its output captured in a per-thread buffer."""
+    buf = io.StringIO()
+    _OUTPUT.buffer = buf
+    try:
+        passed = check_func()
+    finally:
+        _OUTPUT.buffer = None
+    return passed, buf.getvalue()
+
+
+def load_app_content() -> bool:
+    """Read app.py into the shared APP_CONTENT string (once per run)."""
+    global APP_CONTENT, APP_LINES, FOUND
+    # Single syscall: let the read itself report a missing file instead of
+    # stat()-ing first.
+    try:
+        raw = APP_PATH.read_bytes()
+    except FileNotFoundError:
+        return False
+    # Count newlines on the raw bytes (single C scan, readlines() semantics)
+    APP_LINES = raw.count(b"\n")
+    if raw and not raw.endswith(b"\n"):
+        APP_LINES += 1
+    APP_CONTENT = raw.decode("utf-8")
+    FOUND = sweep(APP_CONTENT, NEEDLES)
+    return True
 
 
-def validate_file_exists(filepath: Path, min_lines: int = 100) -> bool:
+def validate_file_exists(filepath: Path, line_count: int, min_lines: int = 100) -> bool:
     """Validate that file exists and has minimum lines."""
     if not filepath.exists():
         print_error(f"File not found: {filepath}")
         return False
     
-    with open(filepath, 'r') as f:
-        line_count = len(f.readlines())
-    
     if line_count < min_lines:
         print_error(f"File too short: {filepath} ({line_count} lines, expected >= {min_lines})")
         return False
@@ -73,29 +244,35 @@ def validate_file_exists(filepath: Path, min_lines: int = 100) -> bool:
     return True
 
 
-def validate_imports(filepath: Path, required_imports: list) -> bool:
+def validate_imports(content: str) -> bool:
     """Validate that required imports exist."""
-    with open(filepath, 'r') as f:
-        content = f.read()
+    present = set(_IMPORTS_RE.findall(content))
+    missing = [s for s in REQUIRED_IMPORTS if s not in present]
     
-    all_found = True
-    for import_str in required_imports:
-        if import_str not in content:
-            print_error(f"Import not found: {import_str}")
-            all_found = False
+    for import_str in missing:
+        print_error(f"Import not found: {import_str}")
     
-    if all_found:
+    if not missing:
         print_success(f"All required imports exist")
     
-    return all_found
+    return not missing
+
 
+@lru_cache(maxsize=None)
+def _class_exists(content: str, class_name: str) -> bool:
+    """Memoized token scan; content is the shared APP_CONTENT string."""
+    return f"class {class_name}" in content
 
-def validate_class_exists(filepath: Path, class_name: str) -> bool:
+
+@lru_cache(maxsize=None)
+def _function_exists(content: str, function_name: str) -> bool:
+    """Memoized token scan; content is the shared APP_CONTENT string."""
+    return f"def {function_name}" in content
+
+
+def validate_class_exists(content: str, class_name: str) -> bool:
     """Validate that class is defined in file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    if f"class {class_name}" not in content:
+    if not _class_exists(content, class_name):
         print_error(f"Class not found: {class_name}")
         return False
     
@@ -103,12 +280,9 @@ def validate_class_exists(filepath: Path, class_name: str) -> bool:
     return True
 
 
-def validate_function_exists(filepath: Path, function_name: str) -> bool:
+def validate_function_exists(content: str, function_name: str) -> bool:
     """Validate that function is defined in file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    if f"def {function_name}" not in content:
+    if not _function_exists(content, function_name):
         print_error(f"Function not found: {function_name}")
         return False
     
@@ -119,349 +293,112 @@ def validate_function_exists(filepath: Path, function_name: str) -> bool:
 def validate_app_structure() -> bool:
     """Validate app.py structure."""
     print_header("Validating app.py Structure")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    checks = []
-    
-    # Check file exists
-    checks.append(validate_file_exists(filepath, min_lines=700))
-    
-    # Check required imports
-    required_imports = [
-        "import argparse",
-        "import logging",
-        "import signal",
-        "import threading",
-        "from fastapi import FastAPI",
-        "from prometheus_client import",
-        "import uvicorn",
-        "from kvs_infer.config import load_config",
-        "from kvs_infer.frame_source.kvs_hls import KVSHLSFrameSource",
-        "from kvs_infer.detectors import DetectorRegistry",
-        "from kvs_infer.publisher import KDSClient, S3Snapshot, DDBWriter",
-    ]
-    checks.append(validate_imports(filepath, required_imports))
-    
-    # Check required classes
-    checks.append(validate_class_exists(filepath, "CameraWorker"))
-    checks.append(validate_class_exists(filepath, "Application"))
-    checks.append(validate_class_exists(filepath, "JSONFormatter"))
-    
-    # Check required functions
-    checks.append(validate_function_exists(filepath, "main"))
-    checks.append(validate_function_exists(filepath, "parse_args"))
-    checks.append(validate_function_exists(filepath, "setup_logging"))
-    
-    return all(checks)
-
-
-def validate_cli_functionality() -> bool:
-    """Validate CLI argument parsing."""
-    print_header("Validating CLI Functionality")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for ArgumentParser
-    if "ArgumentParser" in content:
-        print_success("ArgumentParser found")
-        checks.append(True)
-    else:
-        print_error("ArgumentParser not found")
-        checks.append(False)
-    
-    # Check for --config argument
-    if "--config" in content:
-        print_success("--config argument found")
-        checks.append(True)
-    else:
-        print_error("--config argument not found")
-        checks.append(False)
-    
-    # Check for --http argument
-    if "--http" in content:
-        print_success("--http argument found")
-        checks.append(True)
-    else:
-        print_error("--http argument not found")
-        checks.append(False)
-    
-    return all(checks)
-
-
-def validate_worker_management() -> bool:
-    """Validate worker management."""
-    print_header("Validating Worker Management")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for worker start
-    if "def start(self):" in content and "self.thread = threading.Thread" in content:
-        print_success("Worker start() method found")
-        checks.append(True)
-    else:
-        print_error("Worker start() method not properly implemented")
-        checks.append(False)
-    
-    # Check for worker stop
-    if "def stop(self):" in content and "self.running = False" in content:
-        print_success("Worker stop() method found")
-        checks.append(True)
-    else:
-        print_error("Worker stop() method not properly implemented")
-        checks.append(False)
-    
-    # Check for detector initialization
-    if "_initialize_detectors" in content:
-        print_success("Detector initialization found")
-        checks.append(True)
-    else:
-        print_error("Detector initialization not found")
-        checks.append(False)
-    
-    # Check for frame source initialization
-    if "_initialize_frame_source" in content:
-        print_success("Frame source initialization found")
-        checks.append(True)
-    else:
-        print_error("Frame source initialization not found")
-        checks.append(False)
-    
-    return all(checks)
-
-
-def validate_fastapi_endpoints() -> bool:
-    """Validate FastAPI endpoints."""
-    print_header("Validating FastAPI Endpoints")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for FastAPI app
-    if "app = FastAPI" in content:
-        print_success("FastAPI app instance found")
-        checks.append(True)
-    else:
-        print_error("FastAPI app instance not found")
-        checks.append(False)
-    
-    # Check for /healthz endpoint
-    if '@app.get("/healthz")' in content or "@app.get('/healthz')" in content:
-        print_success("/healthz endpoint found")
-        checks.append(True)
-    else:
-        print_error("/healthz endpoint not found")
-        checks.append(False)
-    
-    # Check for /metrics endpoint
-    if '@app.get("/metrics")' in content or "@app.get('/metrics')" in content:
-        print_success("/metrics endpoint found")
-        checks.append(True)
-    else:
-        print_error("/metrics endpoint not found")
-        checks.append(False)
-    
-    # Check for uvicorn
-    if "uvicorn.run" in content:
-        print_success("uvicorn server found")
-        checks.append(True)
-    else:
-        print_error("uvicorn server not found")
-        checks.append(False)
-    
-    return all(checks)
-
-
-def validate_prometheus_metrics() -> bool:
-    """Validate Prometheus metrics."""
-    print_header("Validating Prometheus Metrics")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for metrics
-    required_metrics = [
-        "infer_frames_total",
-        "infer_events_total",
-        "infer_latency_ms",
-        "publisher_failures_total",
-        "worker_alive",
-    ]
-    
-    for metric in required_metrics:
-        if metric in content:
-            print_success(f"Metric found: {metric}")
-            checks.append(True)
-        else:
-            print_error(f"Metric not found: {metric}")
-            checks.append(False)
-    
-    # Check for Counter/Gauge/Histogram
-    metric_types = ["Counter", "Gauge", "Histogram"]
-    for metric_type in metric_types:
-        if metric_type in content:
-            print_success(f"Metric type found: {metric_type}")
-            checks.append(True)
-        else:
-            print_error(f"Metric type not found: {metric_type}")
-            checks.append(False)
-    
-    return all(checks)
-
-
-def validate_signal_handlers() -> bool:
-    """Validate signal handlers."""
-    print_header("Validating Signal Handlers")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for signal.signal
-    if "signal.signal" in content:
-        print_success("signal.signal found")
-        checks.append(True)
-    else:
-        print_error("signal.signal not found")
-        checks.append(False)
-    
-    # Check for SIGTERM
-    if "SIGTERM" in content:
-        print_success("SIGTERM handler found")
-        checks.append(True)
-    else:
-        print_error("SIGTERM handler not found")
-        checks.append(False)
-    
-    # Check for SIGINT
-    if "SIGINT" in content:
-        print_success("SIGINT handler found")
-        checks.append(True)
-    else:
-        print_error("SIGINT handler not found")
-        checks.append(False)
-    
-    # Check for graceful shutdown
-    if "def shutdown" in content:
-        print_success("Shutdown method found")
-        checks.append(True)
-    else:
-        print_error("Shutdown method not found")
-        checks.append(False)
-    
-    return all(checks)
-
-
-def validate_publisher_integration() -> bool:
-    """Validate publisher integration."""
-    print_header("Validating Publisher Integration")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for publisher initialization
-    if "initialize_publishers" in content:
-        print_success("Publisher initialization found")
-        checks.append(True)
-    else:
-        print_error("Publisher initialization not found")
-        checks.append(False)
-    
-    # Check for KDS
-    if "KDSClient" in content:
-        print_success("KDS publisher integration found")
-        checks.append(True)
-    else:
-        print_error("KDS publisher integration not found")
-        checks.append(False)
-    
-    # Check for S3
-    if "S3Snapshot" in content:
-        print_success("S3 publisher integration found")
-        checks.append(True)
-    else:
-        print_error("S3 publisher integration not found")
-        checks.append(False)
-    
-    # Check for DDB
-    if "DDBWriter" in content:
-        print_success("DDB publisher integration found")
-        checks.append(True)
-    else:
-        print_error("DDB publisher integration not found")
-        checks.append(False)
-    
-    # Check for flush
-    if "flush()" in content:
-        print_success("Publisher flush found")
-        checks.append(True)
-    else:
-        print_error("Publisher flush not found")
-        checks.append(False)
-    
-    return all(checks)
 
-
-def validate_json_logging() -> bool:
-    """Validate JSON logging."""
-    print_header("Validating JSON Logging")
-    
-    filepath = Path("src/kvs_infer/app.py")
-    
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
-    # Check for JSONFormatter
-    if "class JSONFormatter" in content:
-        print_success("JSONFormatter class found")
-        checks.append(True)
-    else:
-        print_error("JSONFormatter class not found")
-        checks.append(False)
-    
-    # Check for json.dumps
-    if "json.dumps" in content:
-        print_success("JSON serialization found")
-        checks.append(True)
-    else:
-        print_error("JSON serialization not found")
-        checks.append(False)
-    
-    # Check for LOG_LEVEL
-    if "LOG_LEVEL" in content:
-        print_success("LOG_LEVEL environment variable support found")
-        checks.append(True)
-    else:
-        print_error("LOG_LEVEL environment variable support not found")
-        checks.append(False)
-    
-    return all(checks)
+    def checks():
+        # File existence first, then imports, classes and functions; the
+        # all() below stops at the first failure.
+        yield validate_file_exists(APP_PATH, APP_LINES, min_lines=700)
+        yield validate_imports(APP_CONTENT)
+        yield validate_class_exists(APP_CONTENT, "CameraWorker")
+        yield validate_class_exists(APP_CONTENT, "Application")
+        yield validate_class_exists(APP_CONTENT, "JSONFormatter")
+        yield validate_function_exists(APP_CONTENT, "main")
+        yield validate_function_exists(APP_CONTENT, "parse_args")
+        yield validate_function_exists(APP_CONTENT, "setup_logging")
+    
+    return all(checks())
+
+
+# Metric names and types are needles in the shared sweep, so the per-item
+# checks below are O(1) set-membership tests against FOUND — equivalent to
+# set-difference reporting but keeping the original per-item output order.
+REQUIRED_METRICS = (
+    "infer_frames_total",
+    "infer_events_total",
+    "infer_latency_ms",
+    "publisher_failures_total",
+    "worker_alive",
+)
+METRIC_TYPES = ("Counter", "Gauge", "Histogram")
+
+
+SECTIONS = (
+    Section("CLI Functionality", (
+        Check(("ArgumentParser",), "ArgumentParser found", "ArgumentParser not found"),
+        Check(("--config",), "--config argument found", "--config argument not found"),
+        Check(("--http",), "--http argument found", "--http argument not found"),
+    )),
+    Section("Worker Management", (
+        Check(
+            ("def start(self):", "self.thread = threading.Thread"),
+            "Worker start() method found",
+            "Worker start() method not properly implemented",
+            require_all=True,
+        ),
+        Check(
+            ("def stop(self):", "self.running = False"),
+            "Worker stop() method found",
+            "Worker stop() method not properly implemented",
+            require_all=True,
+        ),
+        Check(("_initialize_detectors",), "Detector initialization found", "Detector initialization not found"),
+        Check(("_initialize_frame_source",), "Frame source initialization found", "Frame source initialization not found"),
+    )),
+    Section("FastAPI Endpoints", (
+        Check(("app = FastAPI",), "FastAPI app instance found", "FastAPI app instance not found"),
+        Check(
+            ('@app.get("/healthz")', "@app.get('/healthz')"),
+            "/healthz endpoint found",
+            "/healthz endpoint not found",
+        ),
+        Check(
+            ('@app.get("/metrics")', "@app.get('/metrics')"),
+            "/metrics endpoint found",
+            "/metrics endpoint not found",
+        ),
+        Check(("uvicorn.run",), "uvicorn server found", "uvicorn server not found"),
+    )),
+    Section("Prometheus Metrics", tuple(
+        Check((metric,), f"Metric found: {metric}", f"Metric not found: {metric}")
+        for metric in REQUIRED_METRICS
+    ) + tuple(
+        Check((mtype,), f"Metric type found: {mtype}", f"Metric type not found: {mtype}")
+        for mtype in METRIC_TYPES
+    )),
+    Section("Signal Handlers", (
+        Check(("signal.signal",), "signal.signal found", "signal.signal not found"),
+        Check(("SIGTERM",), "SIGTERM handler found", "SIGTERM handler not found"),
+        Check(("SIGINT",), "SIGINT handler found", "SIGINT handler not found"),
+        Check(("def shutdown",), "Shutdown method found", "Shutdown method not found"),
+    )),
+    Section("Publisher Integration", (
+        Check(("initialize_publishers",), "Publisher initialization found", "Publisher initialization not found"),
+        Check(("KDSClient",), "KDS publisher integration found", "KDS publisher integration not found"),
+        Check(("S3Snapshot",), "S3 publisher integration found", "S3 publisher integration not found"),
+        Check(("DDBWriter",), "DDB publisher integration found", "DDB publisher integration not found"),
+        Check(("flush()",), "Publisher flush found", "Publisher flush not found"),
+    )),
+    Section("JSON Logging", (
+        Check(("class JSONFormatter",), "JSONFormatter class found", "JSONFormatter class not found"),
+        Check(("json.dumps",), "JSON serialization found", "JSON serialization not found"),
+        Check(("LOG_LEVEL",), "LOG_LEVEL environment variable support found", "LOG_LEVEL environment variable support not found"),
+    )),
+)
+
+
+def run_section(section: Section) -> bool:
+    """Run one section of needle checks against the shared FOUND set."""
+    print_header(f"Validating {section.name}")
+    
+    # all() short-circuits on the first failing check, skipping the doomed rest
+    return all(
+        report(
+            (all if check.require_all else any)(needle in FOUND for needle in check.needles),
+            check.found_msg,
+            check.missing_msg,
+        )
+        for check in section.checks
+    )
 
 
 def validate_config_file() -> bool:
@@ -470,28 +407,21 @@ def validate_config_file() -> bool:
     
     filepath = Path("config/cameras.yaml")
     
-    if not filepath.exists():
+    # One read covers both the existence check and the content scan
+    try:
+        content = filepath.read_bytes().decode("utf-8")
+    except FileNotFoundError:
         print_error(f"Config file not found: {filepath}")
         return False
     
     print_success(f"Config file exists: {filepath}")
     
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    checks = []
-    
     # Check for required sections
-    required_sections = ["publishers", "cameras"]
-    for section in required_sections:
-        if f"{section}:" in content:
-            print_success(f"Section found: {section}")
-            checks.append(True)
-        else:
-            print_error(f"Section not found: {section}")
-            checks.append(False)
-    
-    return all(checks)
+    required_sections = ("publishers", "cameras")
+    return all(
+        report(f"{section}:" in content, f"Section found: {section}", f"Section not found: {section}")
+        for section in required_sections
+    )
 
 
 def main():
@@ -502,18 +432,29 @@ def main():
     print_info("Checking: CLI, workers, FastAPI, Prometheus, signal handlers")
     print_info("")
     
-    results = []
+    validators = [("App Structure", validate_app_structure)]
+    validators += [(section.name, partial(run_section, section)) for section in SECTIONS]
     
-    # Validate components
-    results.append(("App Structure", validate_app_structure()))
-    results.append(("CLI Functionality", validate_cli_functionality()))
-    results.append(("Worker Management", validate_worker_management()))
-    results.append(("FastAPI Endpoints", validate_fastapi_endpoints()))
-    results.append(("Prometheus Metrics", validate_prometheus_metrics()))
-    results.append(("Signal Handlers", validate_signal_handlers()))
-    results.append(("Publisher Integration", validate_publisher_integration()))
-    results.append(("JSON Logging", validate_json_logging()))
-    results.append(("Example Config", validate_config_file()))
+    # Single read shared by all validators below; if app.py is missing there
+    # is no point running the content validators at all.
+    results = []
+    if not load_app_content():
+        print_error(f"File not found: {APP_PATH}")
+        print_warning("Skipping app.py content validation")
+        results = [(name, False) for name, _ in validators]
+        results.append(("Example Config", validate_config_file()))
+    else:
+        validators.append(("Example Config", validate_config_file))
+        
+        # Validators are independent once app.py is in memory; run them on a
+        # small thread pool and flush their buffered output in submission
+        # order.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [(name, executor.submit(run_validator, fn)) for name, fn in validators]
+            for name, future in futures:
+                passed, output = future.result()
+                sys.stdout.write(output)
+                results.append((name, passed))
     
     # Print summary
     print_header("Validation Summary")
@@ -527,15 +468,19 @@ def main():
         else:
             print_error(f"{name}: FAILED")
     
-    print(f"\n{BLUE}{'=' * 80}{RESET}")
+    _out(f"\n{_SEP_LINE}")
     if passed == total:
-        print(f"{GREEN}✓ All checks passed ({passed}/{total}){RESET}")
-        print(f"{GREEN}Step 6 implementation is complete and valid!{RESET}")
-        return 0
+        _out(f"{GREEN}✓ All checks passed ({passed}/{total}){RESET}")
+        _out(f"{GREEN}Step 6 implementation is complete and valid!{RESET}")
+        exit_code = 0
     else:
-        print(f"{RED}✗ Some checks failed ({passed}/{total}){RESET}")
-        print(f"{RED}Please fix the issues above.{RESET}")
-        return 1
+        _out(f"{RED}✗ Some checks failed ({passed}/{total}){RESET}")
+        _out(f"{RED}Please fix the issues above.{RESET}")
+        exit_code = 1
+    
+    # Single flush for the whole run
+    sys.stdout.flush()
+    return exit_code
 
 
 if __name__ == "__main__":
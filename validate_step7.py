@@ -16,28 +16,116 @@ Validates:
 Run: python3 validate_step7.py
 """
 
+import io
+import mmap
+from fractions import Fraction
+from functools import lru_cache
+import re
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import inspect
 
-# Color codes
-GREEN = "\033[92m"
-RED = "\033[91m"
-BLUE = "\033[94m"
-YELLOW = "\033[93m"
-RESET = "\033[0m"
+# Matches top-level and nested def/class names in one pass over the file
+_RE_DEFS = re.compile(rb"^\s*(?:def\s+(\w+)|class\s+(\w+))", re.M)
+
+
+@lru_cache(maxsize=32)
+def _mmap_file(path: Path) -> mmap.mmap:
+    """Memory-map a file read-only for scanning (memoized per path).
+
+    The structural checks only look for ASCII markers, so scanning the
+    mapped bytes skips the UTF-8 decode and full-file str copy that
+    read_text() would pay. Caching the map means repeated runs in a
+    long-lived process (watch mode, pytest workers) open each file once.
+    """
+    with path.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _count_newlines(mm: mmap.mmap) -> int:
+    """Count newlines in a mapped file without copying it."""
+    count = 0
+    pos = mm.find(b"\n")
+    while pos != -1:
+        count += 1
+        pos = mm.find(b"\n", pos + 1)
+    return count
+
+# Color codes (disabled when stdout is piped, e.g. CI log files)
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    RED = "\033[91m"
+    BLUE = "\033[94m"
+    YELLOW = "\033[93m"
+    RESET = "\033[0m"
+else:
+    GREEN = RED = BLUE = YELLOW = RESET = ""
+
+# Precomputed status prefixes so the print paths skip per-call ANSI assembly
+_OK = f"{GREEN}✓{RESET} "
+_FAIL = f"{RED}✗{RESET} "
+_WARN = f"{YELLOW}⚠{RESET} "
+_SEP = f"{BLUE}{'='*80}{RESET}"
+
+
+# Import the utilities once at module scope instead of re-running the
+# from-import bytecode inside every validator. Failures are kept and
+# re-raised per validator so each check still reports cleanly.
+try:
+    from src.kvs_infer import utils
+    from src.kvs_infer.utils import (
+        TemporalBuffer,
+        filter_boxes_by_roi,
+        iou,
+        point_in_polygon,
+        temporal_confirm,
+    )
+    _UTILS_ERROR = None
+except Exception as e:  # pragma: no cover - only on broken trees
+    _UTILS_ERROR = e
+
+
+class _ThreadLocalStdout:
+    """stdout stand-in routing each thread's writes to its own buffer.
+
+    Threads without a pushed buffer fall through to the real stream.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def push(self, buf):
+        self._local.buf = buf
+
+    def pop(self):
+        self._local.buf = None
+
+    def write(self, s):
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self._real).write(s)
+
+    def flush(self):
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            self._real.flush()
+
+
+_STDOUT_PROXY = _ThreadLocalStdout(sys.stdout)
 
 
 def check_mark(passed: bool) -> str:
     """Return colored checkmark or X."""
-    return f"{GREEN}✓{RESET}" if passed else f"{RED}✗{RESET}"
+    return _OK[:-1] if passed else _FAIL[:-1]
 
 
 def print_header(text: str):
     """Print section header."""
-    print(f"\n{BLUE}{'='*80}{RESET}")
+    print("\n" + _SEP)
     print(f"{BLUE}{text}{RESET}")
-    print(f"{BLUE}{'='*80}{RESET}")
+    print(_SEP)
 
 
 def validate_roi_file_structure() -> bool:
@@ -48,14 +136,18 @@ def validate_roi_file_structure() -> bool:
         roi_file = Path("src/kvs_infer/utils/roi.py")
         
         if not roi_file.exists():
-            print(f"{RED}✗ File not found: {roi_file}{RESET}")
+            print(_FAIL + f"File not found: {roi_file}")
             return False
         
-        print(f"{GREEN}✓ File exists: {roi_file}{RESET}")
-        
-        # Read file content
-        content = roi_file.read_text()
+        print(_OK + f"File exists: {roi_file}")
         
+        # Scan the file via mmap (no decode, no full copy)
+        content = _mmap_file(roi_file)
+
+        # Collect every def/class name in a single regex sweep instead of
+        # one substring scan per required name
+        defs = {(m[0] or m[1]).decode() for m in _RE_DEFS.findall(content)}
+
         # Check for required functions
         required_functions = [
             "point_in_polygon",
@@ -64,38 +156,38 @@ def validate_roi_file_structure() -> bool:
             "bbox_overlaps_roi",
             "temporal_confirm",
         ]
-        
+
         for func in required_functions:
-            if f"def {func}" in content:
-                print(f"{GREEN}✓ Function exists: {func}{RESET}")
+            if func in defs:
+                print(_OK + f"Function exists: {func}")
             else:
-                print(f"{RED}✗ Function missing: {func}{RESET}")
+                print(_FAIL + f"Function missing: {func}")
                 return False
-        
+
         # Check for TemporalBuffer class
-        if "class TemporalBuffer" in content:
-            print(f"{GREEN}✓ Class exists: TemporalBuffer{RESET}")
+        if "TemporalBuffer" in defs:
+            print(_OK + "Class exists: TemporalBuffer")
         else:
-            print(f"{RED}✗ Class missing: TemporalBuffer{RESET}")
+            print(_FAIL + "Class missing: TemporalBuffer")
             return False
         
         # Check for key phrases (Shapely-free implementation)
-        if "Shapely-free" in content:
-            print(f"{GREEN}✓ Shapely-free implementation confirmed{RESET}")
+        if content.find(b"Shapely-free") != -1:
+            print(_OK + "Shapely-free implementation confirmed")
         else:
-            print(f"{YELLOW}⚠ No explicit 'Shapely-free' mention{RESET}")
+            print(_WARN + "No explicit 'Shapely-free' mention")
         
         # Check file size
-        lines = content.count('\n')
-        print(f"{GREEN}✓ File size: {lines} lines{RESET}")
+        lines = _count_newlines(content)
+        print(_OK + f"File size: {lines} lines")
         
         if lines < 400:
-            print(f"{YELLOW}⚠ File seems small ({lines} lines), expected ~500+{RESET}")
+            print(_WARN + f"File seems small ({lines} lines), expected ~500+")
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error validating file: {e}{RESET}")
+        print(_FAIL + f"Error validating file: {e}")
         return False
 
 
@@ -104,7 +196,8 @@ def validate_point_in_polygon() -> bool:
     print("\n🔺 Validating point_in_polygon function...")
     
     try:
-        from src.kvs_infer.utils import point_in_polygon
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         # Test 1: Point inside square
         square = [(0, 0), (100, 0), (100, 100), (0, 100)]
@@ -112,46 +205,46 @@ def validate_point_in_polygon() -> bool:
         
         result = point_in_polygon(inside_point, square)
         if result:
-            print(f"{GREEN}✓ Test 1 passed: Point (50, 50) inside square{RESET}")
+            print(_OK + "Test 1 passed: Point (50, 50) inside square")
         else:
-            print(f"{RED}✗ Test 1 failed: Point (50, 50) should be inside square{RESET}")
+            print(_FAIL + "Test 1 failed: Point (50, 50) should be inside square")
             return False
         
         # Test 2: Point outside square
         outside_point = (150, 50)
         result = point_in_polygon(outside_point, square)
         if not result:
-            print(f"{GREEN}✓ Test 2 passed: Point (150, 50) outside square{RESET}")
+            print(_OK + "Test 2 passed: Point (150, 50) outside square")
         else:
-            print(f"{RED}✗ Test 2 failed: Point (150, 50) should be outside square{RESET}")
+            print(_FAIL + "Test 2 failed: Point (150, 50) should be outside square")
             return False
         
         # Test 3: Point on edge (boundary case)
         edge_point = (0, 50)
         result = point_in_polygon(edge_point, square)
-        print(f"{GREEN}✓ Test 3: Point (0, 50) on edge = {result}{RESET}")
+        print(_OK + f"Test 3: Point (0, 50) on edge = {result}")
         
         # Test 4: Complex polygon (triangle)
         triangle = [(0, 0), (100, 0), (50, 100)]
         result = point_in_polygon((50, 30), triangle)
         if result:
-            print(f"{GREEN}✓ Test 4 passed: Point inside triangle{RESET}")
+            print(_OK + "Test 4 passed: Point inside triangle")
         else:
-            print(f"{RED}✗ Test 4 failed: Point should be inside triangle{RESET}")
+            print(_FAIL + "Test 4 failed: Point should be inside triangle")
             return False
         
         # Test 5: Empty polygon
         result = point_in_polygon((50, 50), [])
         if not result:
-            print(f"{GREEN}✓ Test 5 passed: Empty polygon returns False{RESET}")
+            print(_OK + "Test 5 passed: Empty polygon returns False")
         else:
-            print(f"{RED}✗ Test 5 failed: Empty polygon should return False{RESET}")
+            print(_FAIL + "Test 5 failed: Empty polygon should return False")
             return False
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -162,7 +255,8 @@ def validate_iou() -> bool:
     print("\n📐 Validating iou function...")
     
     try:
-        from src.kvs_infer.utils import iou
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         # Test 1: Perfect overlap (identical boxes)
         box1 = [0, 0, 100, 100]
@@ -170,9 +264,9 @@ def validate_iou() -> bool:
         result = iou(box1, box2)
         
         if abs(result - 1.0) < 0.001:
-            print(f"{GREEN}✓ Test 1 passed: Identical boxes IoU = {result:.3f}{RESET}")
+            print(_OK + f"Test 1 passed: Identical boxes IoU = {result:.3f}")
         else:
-            print(f"{RED}✗ Test 1 failed: IoU should be 1.0, got {result:.3f}{RESET}")
+            print(_FAIL + f"Test 1 failed: IoU should be 1.0, got {result:.3f}")
             return False
         
         # Test 2: No overlap
@@ -181,9 +275,9 @@ def validate_iou() -> bool:
         result = iou(box1, box2)
         
         if result == 0.0:
-            print(f"{GREEN}✓ Test 2 passed: No overlap IoU = {result}{RESET}")
+            print(_OK + f"Test 2 passed: No overlap IoU = {result}")
         else:
-            print(f"{RED}✗ Test 2 failed: IoU should be 0.0, got {result:.3f}{RESET}")
+            print(_FAIL + f"Test 2 failed: IoU should be 0.0, got {result:.3f}")
             return False
         
         # Test 3: Partial overlap
@@ -194,12 +288,12 @@ def validate_iou() -> bool:
         # Expected: intersection = 50x50 = 2500
         # Union = 10000 + 10000 - 2500 = 17500
         # IoU = 2500 / 17500 = 0.142857
-        expected = 2500 / 17500
+        expected = float(Fraction(2500, 17500))
         
-        if abs(result - expected) < 0.001:
-            print(f"{GREEN}✓ Test 3 passed: Partial overlap IoU = {result:.3f} (expected {expected:.3f}){RESET}")
+        if abs(result - expected) < 1e-9:
+            print(_OK + f"Test 3 passed: Partial overlap IoU = {result:.3f} (expected {expected:.3f})")
         else:
-            print(f"{RED}✗ Test 3 failed: IoU should be {expected:.3f}, got {result:.3f}{RESET}")
+            print(_FAIL + f"Test 3 failed: IoU should be {expected:.3f}, got {result:.3f}")
             return False
         
         # Test 4: One box inside another
@@ -210,18 +304,32 @@ def validate_iou() -> bool:
         # intersection = 50x50 = 2500
         # union = 10000 + 2500 - 2500 = 10000
         # IoU = 2500 / 10000 = 0.25
-        expected = 0.25
+        expected = float(Fraction(2500, 10000))
         
-        if abs(result - expected) < 0.001:
-            print(f"{GREEN}✓ Test 4 passed: Nested boxes IoU = {result:.3f}{RESET}")
+        if abs(result - expected) < 1e-9:
+            print(_OK + f"Test 4 passed: Nested boxes IoU = {result:.3f}")
         else:
-            print(f"{RED}✗ Test 4 failed: IoU should be {expected:.3f}, got {result:.3f}{RESET}")
+            print(_FAIL + f"Test 4 failed: IoU should be {expected:.3f}, got {result:.3f}")
+            return False
+        
+        # Test 5: Unit-offset overlap - guards against off-by-one (+1)
+        # area inflation: 9x9 intersection over 100+100-81 union
+        box1 = [0, 0, 10, 10]
+        box2 = [1, 1, 11, 11]
+        result = iou(box1, box2)
+        
+        expected = float(Fraction(81, 119))
+        
+        if abs(result - expected) < 1e-9:
+            print(_OK + f"Test 5 passed: Unit-offset IoU = {result:.6f} (expected 81/119)")
+        else:
+            print(_FAIL + f"Test 5 failed: IoU should be {expected:.6f}, got {result:.6f}")
             return False
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -232,7 +340,8 @@ def validate_filter_boxes_by_roi() -> bool:
     print("\n🎯 Validating filter_boxes_by_roi function...")
     
     try:
-        from src.kvs_infer.utils import filter_boxes_by_roi
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         # Test data
         boxes = [
@@ -247,50 +356,50 @@ def validate_filter_boxes_by_roi() -> bool:
         filtered = filter_boxes_by_roi(boxes, [roi], mode="center")
         
         if len(filtered) == 1 and filtered[0][0] == "person":
-            print(f"{GREEN}✓ Test 1 passed: Mode 'center' filtered correctly (1 box){RESET}")
+            print(_OK + "Test 1 passed: Mode 'center' filtered correctly (1 box)")
         else:
-            print(f"{RED}✗ Test 1 failed: Expected 1 box, got {len(filtered)}{RESET}")
+            print(_FAIL + f"Test 1 failed: Expected 1 box, got {len(filtered)}")
             return False
         
         # Test 2: Mode "any" (any corner inside)
         filtered = filter_boxes_by_roi(boxes, [roi], mode="any")
         
         if len(filtered) >= 1:
-            print(f"{GREEN}✓ Test 2 passed: Mode 'any' filtered correctly ({len(filtered)} boxes){RESET}")
+            print(_OK + f"Test 2 passed: Mode 'any' filtered correctly ({len(filtered)} boxes)")
         else:
-            print(f"{RED}✗ Test 2 failed: Expected at least 1 box{RESET}")
+            print(_FAIL + "Test 2 failed: Expected at least 1 box")
             return False
         
         # Test 3: No ROI (should return all boxes)
         filtered = filter_boxes_by_roi(boxes, None, mode="center")
         
         if len(filtered) == 3:
-            print(f"{GREEN}✓ Test 3 passed: No ROI returns all boxes{RESET}")
+            print(_OK + "Test 3 passed: No ROI returns all boxes")
         else:
-            print(f"{RED}✗ Test 3 failed: Expected 3 boxes, got {len(filtered)}{RESET}")
+            print(_FAIL + f"Test 3 failed: Expected 3 boxes, got {len(filtered)}")
             return False
         
         # Test 4: Empty ROI list (should return all boxes)
         filtered = filter_boxes_by_roi(boxes, [], mode="center")
         
         if len(filtered) == 3:
-            print(f"{GREEN}✓ Test 4 passed: Empty ROI list returns all boxes{RESET}")
+            print(_OK + "Test 4 passed: Empty ROI list returns all boxes")
         else:
-            print(f"{RED}✗ Test 4 failed: Expected 3 boxes, got {len(filtered)}{RESET}")
+            print(_FAIL + f"Test 4 failed: Expected 3 boxes, got {len(filtered)}")
             return False
         
         # Test 5: Invalid mode (should raise error)
         try:
             filtered = filter_boxes_by_roi(boxes, [roi], mode="invalid")
-            print(f"{RED}✗ Test 5 failed: Should raise ValueError for invalid mode{RESET}")
+            print(_FAIL + "Test 5 failed: Should raise ValueError for invalid mode")
             return False
         except ValueError:
-            print(f"{GREEN}✓ Test 5 passed: Raises ValueError for invalid mode{RESET}")
+            print(_OK + "Test 5 passed: Raises ValueError for invalid mode")
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -301,15 +410,16 @@ def validate_temporal_buffer() -> bool:
     print("\n⏱️  Validating TemporalBuffer class...")
     
     try:
-        from src.kvs_infer.utils import TemporalBuffer
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         # Test 1: Create buffer
         buffer = TemporalBuffer(maxlen=5)
         
         if buffer.size() == 0 and buffer.is_empty():
-            print(f"{GREEN}✓ Test 1 passed: Buffer initialized (empty){RESET}")
+            print(_OK + "Test 1 passed: Buffer initialized (empty)")
         else:
-            print(f"{RED}✗ Test 1 failed: Buffer should be empty{RESET}")
+            print(_FAIL + "Test 1 failed: Buffer should be empty")
             return False
         
         # Test 2: Add detections
@@ -318,36 +428,36 @@ def validate_temporal_buffer() -> bool:
         buffer.add("weapon", [101, 99, 201, 199], 0.91, frame_idx=3)
         
         if buffer.size() == 3:
-            print(f"{GREEN}✓ Test 2 passed: Added 3 detections (size={buffer.size()}){RESET}")
+            print(_OK + f"Test 2 passed: Added 3 detections (size={buffer.size()})")
         else:
-            print(f"{RED}✗ Test 2 failed: Expected size=3, got {buffer.size()}{RESET}")
+            print(_FAIL + f"Test 2 failed: Expected size=3, got {buffer.size()}")
             return False
         
         # Test 3: Count similar detections
         count = buffer.count_similar("weapon", [101, 100, 201, 200], iou_threshold=0.5)
         
         if count >= 2:
-            print(f"{GREEN}✓ Test 3 passed: Found {count} similar detections{RESET}")
+            print(_OK + f"Test 3 passed: Found {count} similar detections")
         else:
-            print(f"{RED}✗ Test 3 failed: Expected at least 2 similar, got {count}{RESET}")
+            print(_FAIL + f"Test 3 failed: Expected at least 2 similar, got {count}")
             return False
         
         # Test 4: Get recent detections
         recent = buffer.get_recent(n=2)
         
         if len(recent) == 2:
-            print(f"{GREEN}✓ Test 4 passed: Retrieved {len(recent)} recent detections{RESET}")
+            print(_OK + f"Test 4 passed: Retrieved {len(recent)} recent detections")
         else:
-            print(f"{RED}✗ Test 4 failed: Expected 2 recent, got {len(recent)}{RESET}")
+            print(_FAIL + f"Test 4 failed: Expected 2 recent, got {len(recent)}")
             return False
         
         # Test 5: Clear buffer
         buffer.clear()
         
         if buffer.is_empty():
-            print(f"{GREEN}✓ Test 5 passed: Buffer cleared{RESET}")
+            print(_OK + "Test 5 passed: Buffer cleared")
         else:
-            print(f"{RED}✗ Test 5 failed: Buffer should be empty after clear{RESET}")
+            print(_FAIL + "Test 5 failed: Buffer should be empty after clear")
             return False
         
         # Test 6: Maxlen enforcement
@@ -356,15 +466,15 @@ def validate_temporal_buffer() -> bool:
             buffer.add("test", [0, 0, 10, 10], 0.9, frame_idx=i)
         
         if buffer.size() == 3:
-            print(f"{GREEN}✓ Test 6 passed: Maxlen enforced (size={buffer.size()}){RESET}")
+            print(_OK + f"Test 6 passed: Maxlen enforced (size={buffer.size()})")
         else:
-            print(f"{RED}✗ Test 6 failed: Expected size=3 (maxlen), got {buffer.size()}{RESET}")
+            print(_FAIL + f"Test 6 failed: Expected size=3 (maxlen), got {buffer.size()}")
             return False
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -375,7 +485,8 @@ def validate_temporal_confirm() -> bool:
     print("\n✅ Validating temporal_confirm function...")
     
     try:
-        from src.kvs_infer.utils import TemporalBuffer, temporal_confirm
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         # Test 1: Progressive confirmation
         buffer = TemporalBuffer(maxlen=10)
@@ -383,25 +494,25 @@ def validate_temporal_confirm() -> bool:
         # Frame 1 - not confirmed yet
         confirmed = temporal_confirm(buffer, "weapon", [100, 100, 200, 200], 0.9, min_confirmations=3)
         if not confirmed:
-            print(f"{GREEN}✓ Test 1a passed: Frame 1 not confirmed (need 3){RESET}")
+            print(_OK + "Test 1a passed: Frame 1 not confirmed (need 3)")
         else:
-            print(f"{RED}✗ Test 1a failed: Should not be confirmed on frame 1{RESET}")
+            print(_FAIL + "Test 1a failed: Should not be confirmed on frame 1")
             return False
         
         # Frame 2 - still not confirmed
         confirmed = temporal_confirm(buffer, "weapon", [102, 98, 202, 198], 0.88, min_confirmations=3)
         if not confirmed:
-            print(f"{GREEN}✓ Test 1b passed: Frame 2 not confirmed (need 3){RESET}")
+            print(_OK + "Test 1b passed: Frame 2 not confirmed (need 3)")
         else:
-            print(f"{RED}✗ Test 1b failed: Should not be confirmed on frame 2{RESET}")
+            print(_FAIL + "Test 1b failed: Should not be confirmed on frame 2")
             return False
         
         # Frame 3 - NOW confirmed!
         confirmed = temporal_confirm(buffer, "weapon", [101, 99, 201, 199], 0.91, min_confirmations=3)
         if confirmed:
-            print(f"{GREEN}✓ Test 1c passed: Frame 3 CONFIRMED (3 similar detections){RESET}")
+            print(_OK + "Test 1c passed: Frame 3 CONFIRMED (3 similar detections)")
         else:
-            print(f"{RED}✗ Test 1c failed: Should be confirmed on frame 3{RESET}")
+            print(_FAIL + "Test 1c failed: Should be confirmed on frame 3")
             return False
         
         # Test 2: Different label (shouldn't match)
@@ -411,9 +522,9 @@ def validate_temporal_confirm() -> bool:
         
         confirmed = temporal_confirm(buffer2, "knife", [101, 99, 201, 199], 0.91, min_confirmations=2)
         if not confirmed:
-            print(f"{GREEN}✓ Test 2 passed: Different label not confirmed{RESET}")
+            print(_OK + "Test 2 passed: Different label not confirmed")
         else:
-            print(f"{RED}✗ Test 2 failed: Different label should not match{RESET}")
+            print(_FAIL + "Test 2 failed: Different label should not match")
             return False
         
         # Test 3: Low IoU (shouldn't match)
@@ -426,15 +537,15 @@ def validate_temporal_confirm() -> bool:
             min_confirmations=2, iou_threshold=0.5
         )
         if not confirmed:
-            print(f"{GREEN}✓ Test 3 passed: Low IoU not confirmed{RESET}")
+            print(_OK + "Test 3 passed: Low IoU not confirmed")
         else:
-            print(f"{RED}✗ Test 3 failed: Low IoU should not match{RESET}")
+            print(_FAIL + "Test 3 failed: Low IoU should not match")
             return False
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -447,52 +558,52 @@ def validate_detector_integration() -> bool:
     try:
         # Check weapon detector
         weapon_file = Path("src/kvs_infer/detectors/weapon.py")
-        weapon_content = weapon_file.read_text()
+        weapon_content = _mmap_file(weapon_file)
         
         # Check imports
-        if "from ..utils import filter_boxes_by_roi" in weapon_content:
-            print(f"{GREEN}✓ WeaponDetector imports filter_boxes_by_roi{RESET}")
+        if weapon_content.find(b"from ..utils import filter_boxes_by_roi") != -1:
+            print(_OK + "WeaponDetector imports filter_boxes_by_roi")
         else:
-            print(f"{RED}✗ WeaponDetector missing filter_boxes_by_roi import{RESET}")
+            print(_FAIL + "WeaponDetector missing filter_boxes_by_roi import")
             return False
         
-        if "TemporalBuffer" in weapon_content:
-            print(f"{GREEN}✓ WeaponDetector imports TemporalBuffer{RESET}")
+        if weapon_content.find(b"TemporalBuffer") != -1:
+            print(_OK + "WeaponDetector imports TemporalBuffer")
         else:
-            print(f"{RED}✗ WeaponDetector missing TemporalBuffer import{RESET}")
+            print(_FAIL + "WeaponDetector missing TemporalBuffer import")
             return False
         
         # Check configuration options
-        if "roi_filter_mode" in weapon_content:
-            print(f"{GREEN}✓ WeaponDetector has roi_filter_mode config{RESET}")
+        if weapon_content.find(b"roi_filter_mode") != -1:
+            print(_OK + "WeaponDetector has roi_filter_mode config")
         else:
-            print(f"{YELLOW}⚠ WeaponDetector missing roi_filter_mode config{RESET}")
+            print(_WARN + "WeaponDetector missing roi_filter_mode config")
         
-        if "use_temporal_buffer" in weapon_content:
-            print(f"{GREEN}✓ WeaponDetector has use_temporal_buffer config{RESET}")
+        if weapon_content.find(b"use_temporal_buffer") != -1:
+            print(_OK + "WeaponDetector has use_temporal_buffer config")
         else:
-            print(f"{YELLOW}⚠ WeaponDetector missing use_temporal_buffer config{RESET}")
+            print(_WARN + "WeaponDetector missing use_temporal_buffer config")
         
         # Check process method usage
-        if "filter_boxes_by_roi(" in weapon_content:
-            print(f"{GREEN}✓ WeaponDetector uses filter_boxes_by_roi in process(){RESET}")
+        if weapon_content.find(b"filter_boxes_by_roi(") != -1:
+            print(_OK + "WeaponDetector uses filter_boxes_by_roi in process()")
         else:
-            print(f"{RED}✗ WeaponDetector not using filter_boxes_by_roi{RESET}")
+            print(_FAIL + "WeaponDetector not using filter_boxes_by_roi")
             return False
         
         # Check fire_smoke detector
         fire_smoke_file = Path("src/kvs_infer/detectors/fire_smoke.py")
-        fire_smoke_content = fire_smoke_file.read_text()
+        fire_smoke_content = _mmap_file(fire_smoke_file)
         
-        if "from ..utils import filter_boxes_by_roi" in fire_smoke_content:
-            print(f"{GREEN}✓ FireSmokeDetector imports filter_boxes_by_roi{RESET}")
+        if fire_smoke_content.find(b"from ..utils import filter_boxes_by_roi") != -1:
+            print(_OK + "FireSmokeDetector imports filter_boxes_by_roi")
         else:
-            print(f"{YELLOW}⚠ FireSmokeDetector missing new imports (optional){RESET}")
+            print(_WARN + "FireSmokeDetector missing new imports (optional)")
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -503,7 +614,8 @@ def validate_utils_exports() -> bool:
     print("\n📦 Validating utils/__init__.py exports...")
     
     try:
-        from src.kvs_infer import utils
+        if _UTILS_ERROR is not None:
+            raise _UTILS_ERROR
         
         required_exports = [
             "point_in_polygon",
@@ -515,15 +627,15 @@ def validate_utils_exports() -> bool:
         
         for export in required_exports:
             if hasattr(utils, export):
-                print(f"{GREEN}✓ Exported: {export}{RESET}")
+                print(_OK + f"Exported: {export}")
             else:
-                print(f"{RED}✗ Not exported: {export}{RESET}")
+                print(_FAIL + f"Not exported: {export}")
                 return False
         
         return True
         
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
+        print(_FAIL + f"Error: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -544,17 +656,37 @@ def main():
         ("Utils Exports", validate_utils_exports),
     ]
     
-    results = []
-    
-    for name, check_func in checks:
+    # The checks are independent (file scans and in-process utility calls),
+    # so run them concurrently. sys.stdout is swapped for a thread-local
+    # proxy while the pool runs, so each check's prints land in its own
+    # buffer; buffers are replayed in submission order to keep the report
+    # deterministic.
+    def run_check(check_func):
+        buf = io.StringIO()
+        _STDOUT_PROXY.push(buf)
         try:
             passed = check_func()
-            results.append((name, passed))
         except Exception as e:
-            print(f"\n{RED}✗ {name} raised exception: {e}{RESET}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+            buf.write(f"\n{RED}✗ raised exception: {e}{RESET}\n")
+            buf.write(traceback.format_exc())
+            passed = False
+        finally:
+            _STDOUT_PROXY.pop()
+        return passed, buf.getvalue()
+
+    results = []
+
+    real_stdout = sys.stdout
+    sys.stdout = _STDOUT_PROXY
+    try:
+        with ThreadPoolExecutor(max_workers=min(4, len(checks))) as pool:
+            futures = [pool.submit(run_check, func) for _, func in checks]
+            for (name, _), future in zip(checks, futures):
+                passed, output = future.result()
+                real_stdout.write(output)
+                results.append((name, passed))
+    finally:
+        sys.stdout = real_stdout
     
     # Summary
     print_header("Validation Summary")
@@ -569,11 +701,11 @@ def main():
     print(f"\n{BLUE}{'='*80}{RESET}")
     
     if passed_count == total_count:
-        print(f"{GREEN}✓ All checks passed ({passed_count}/{total_count}){RESET}")
+        print(_OK + f"All checks passed ({passed_count}/{total_count})")
         print(f"{GREEN}Step 7 implementation is complete and valid!{RESET}")
         return 0
     else:
-        print(f"{RED}✗ Some checks failed ({passed_count}/{total_count}){RESET}")
+        print(_FAIL + f"Some checks failed ({passed_count}/{total_count})")
         print(f"{RED}Please review the failures above.{RESET}")
         return 1
 
@@ -15,11 +15,109 @@ Validates:
 Run: python3 validate_step9.py
 """
 
+import argparse
+import functools
+import io
 import sys
 import os
 import json
+import re
+import threading
+import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Optional incremental JSON parser for the deployment documents; stdlib
+# json is the fallback.
+try:
+    import ijson
+    _HAVE_IJSON = True
+except ImportError:
+    _HAVE_IJSON = False
+
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if _HAVE_IJSON else (json.JSONDecodeError,)
+
+# Optional fast JSON decoder; orjson.JSONDecodeError subclasses the stdlib
+# one, so the error handling below covers both.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# README checks, hoisted so the compiled scanners are built once. The
+# alternations are sorted longest-first so no needle hides inside another.
+README_SECTIONS = (
+    "Prerequisites",
+    "Architecture",
+    "Step-by-Step",
+    "ECR",
+    "IAM",
+    "Task Definition",
+    "Service",
+    "Container Insights",
+    "VPC Endpoints",
+    "KVS",
+    "Troubleshooting",
+)
+README_NOTES = (
+    "NAT Gateway",
+    "g4dn",
+    "GPU",
+    "CUDA",
+    "VPC endpoint",
+)
+_README_SECTION_RE = re.compile(
+    "|".join(map(re.escape, sorted(README_SECTIONS, key=len, reverse=True))), re.I
+)
+_README_NOTE_RE = re.compile(
+    "|".join(map(re.escape, sorted(README_NOTES, key=len, reverse=True)))
+)
+
+DEPLOY_FUNCTIONS = (
+    "create_ecr_repo",
+    "build_and_push_image",
+    "create_iam_roles",
+    "create_ecs_cluster",
+    "register_task_definition",
+    "create_security_group",
+    "create_ecs_service",
+)
+_DEPLOY_FUNC_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, DEPLOY_FUNCTIONS)) + r")\b"
+)
+
+ENV_REQUIRED_VARS = (
+    "AWS_REGION",
+    "AWS_ACCOUNT_ID",
+    "ECR_REPO_NAME",
+    "ECS_CLUSTER_NAME",
+    "VPC_ID",
+    "PRIVATE_SUBNET_1",
+    "PRIVATE_SUBNET_2",
+    "KVS_STREAM_PREFIX",
+    "KDS_STREAM_NAME",
+    "S3_BUCKET_NAME",
+    "S3_PREFIX",
+)
+_ENV_VAR_RE = re.compile(
+    "|".join(map(re.escape, sorted(ENV_REQUIRED_VARS, key=len, reverse=True)))
+)
+
+# Required-key tuples for the JSON validators, interned once at import so
+# every membership probe hashes against the cached interned strings.
+REQUIRED_TASK_KEYS = tuple(sys.intern(k) for k in ("family", "containerDefinitions"))
+REQUIRED_SERVICE_KEYS = tuple(sys.intern(k) for k in ("serviceName", "cluster", "taskDefinition"))
+REQUIRED_POLICY_KEYS = tuple(sys.intern(k) for k in ("Version", "Statement"))
+
+
+@functools.cache
+def _keyset(keys: tuple) -> frozenset:
+    """Pre-hashed frozenset for a required-key tuple."""
+    return frozenset(keys)
+
 
 # Color codes
 GREEN = "\033[92m"
@@ -28,6 +126,58 @@ BLUE = "\033[94m"
 YELLOW = "\033[93m"
 RESET = "\033[0m"
 
+# Pre-built status templates so hot loops format the message only
+OK = f"{GREEN}✓ {{}}{RESET}"
+FAIL = f"{RED}✗ {{}}{RESET}"
+WARN = f"{YELLOW}⚠ {{}}{RESET}"
+
+
+class _ThreadLocalStdout:
+    """stdout stand-in routing each thread's writes to its own buffer.
+
+    Threads without a pushed buffer fall through to the real stream.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def push(self, buf):
+        self._local.buf = buf
+
+    def pop(self):
+        self._local.buf = None
+
+    def write(self, s):
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self._real).write(s)
+
+    def flush(self):
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            self._real.flush()
+
+
+_STDOUT_PROXY = _ThreadLocalStdout(sys.stdout)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_text(path_str: str, mtime_ns: int) -> str:
+    """Read a text file once per (path, mtime); repeat readers hit the cache."""
+    return Path(path_str).read_text()
+
+
+def read_text_cached(path: Path) -> str:
+    """Text content of a file through the (path, mtime) cache."""
+    return _read_text(str(path), path.stat().st_mtime_ns)
+
+
+def iter_actions(statements):
+    """Yield every action across policy statements, str- or list-valued."""
+    for stmt in statements:
+        actions = stmt.get("Action", ())
+        yield from ((actions,) if isinstance(actions, str) else actions)
+
 
 def check_mark(passed: bool) -> str:
     """Return colored checkmark or X."""
@@ -41,25 +191,39 @@ def print_header(text: str):
     print(f"{BLUE}{'='*80}{RESET}")
 
 
-def validate_json_file(filepath: Path, required_keys: List[str] = None) -> bool:
-    """Validate JSON file syntax and structure."""
+def load_and_validate_json(filepath: Path, required_keys: Tuple[str, ...] = None) -> Optional[Dict]:
+    """Validate JSON file syntax and structure, returning the parsed data.
+
+    Returns None on failure; callers consume the returned dict so each file
+    is opened and parsed exactly once. With ijson available the top-level
+    pairs are event-streamed instead of materializing the whole document
+    tree at once; the stream is always drained so syntax errors anywhere in
+    the file are still caught.
+    """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        if _HAVE_IJSON:
+            with open(filepath, 'rb') as f:
+                data = dict(ijson.kvitems(f, ''))
+        else:
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
         
         if required_keys:
-            for key in required_keys:
-                if key not in data:
-                    print(f"{RED}✗ Missing required key: {key}{RESET}")
-                    return False
+            # One C-level set difference instead of a lookup per key
+            missing = _keyset(required_keys) - data.keys()
+            if missing:
+                for key in required_keys:
+                    if key in missing:
+                        print(FAIL.format(f"Missing required key: {key}"))
+                        return None
         
-        return True
-    except json.JSONDecodeError as e:
-        print(f"{RED}✗ JSON syntax error: {e}{RESET}")
-        return False
+        return data
+    except _JSON_ERRORS as e:
+        print(FAIL.format(f"JSON syntax error: {e}"))
+        return None
     except Exception as e:
-        print(f"{RED}✗ Error: {e}{RESET}")
-        return False
+        print(FAIL.format(f"Error: {e}"))
+        return None
 
 
 def validate_ecs_task_definition() -> bool:
@@ -69,54 +233,52 @@ def validate_ecs_task_definition() -> bool:
     task_def_file = Path("deployment/ecs/ecs-task-def.json")
     
     if not task_def_file.exists():
-        print(f"{RED}✗ Task definition not found: {task_def_file}{RESET}")
+        print(FAIL.format(f"Task definition not found: {task_def_file}"))
         return False
     
-    print(f"{GREEN}✓ Task definition file exists{RESET}")
+    print(OK.format("Task definition file exists"))
     
-    # Validate JSON syntax
-    if not validate_json_file(task_def_file, ["family", "containerDefinitions"]):
+    # Validate JSON syntax and load content in one parse
+    task_def = load_and_validate_json(task_def_file, REQUIRED_TASK_KEYS)
+    if task_def is None:
         return False
     
-    print(f"{GREEN}✓ JSON syntax valid{RESET}")
+    print(OK.format("JSON syntax valid"))
     
-    # Load and validate content
-    with open(task_def_file, 'r') as f:
-        task_def = json.load(f)
-    
-    # Check required fields
+    # Check required fields; conditions are lazy so a failure skips the
+    # evaluation of everything after it
     checks = [
-        ("family" in task_def, "Task family defined"),
-        ("networkMode" in task_def and task_def["networkMode"] == "awsvpc", "Network mode is awsvpc"),
-        ("requiresCompatibilities" in task_def, "Compatibility requirements defined"),
-        ("containerDefinitions" in task_def, "Container definitions present"),
-        (len(task_def.get("containerDefinitions", [])) > 0, "At least one container defined"),
+        (lambda: "family" in task_def, "Task family defined"),
+        (lambda: task_def.get("networkMode") == "awsvpc", "Network mode is awsvpc"),
+        (lambda: "requiresCompatibilities" in task_def, "Compatibility requirements defined"),
+        (lambda: "containerDefinitions" in task_def, "Container definitions present"),
+        (lambda: len(task_def.get("containerDefinitions", [])) > 0, "At least one container defined"),
     ]
     
     for condition, description in checks:
-        if condition:
-            print(f"{GREEN}✓ {description}{RESET}")
+        if condition():
+            print(OK.format(description))
         else:
-            print(f"{RED}✗ {description}{RESET}")
+            print(FAIL.format(description))
             return False
     
     # Check container configuration
     container = task_def["containerDefinitions"][0]
     
     container_checks = [
-        ("name" in container, "Container name defined"),
-        ("image" in container, "Container image defined"),
-        ("resourceRequirements" in container, "Resource requirements defined"),
-        ("logConfiguration" in container, "Log configuration defined"),
-        ("healthCheck" in container, "Health check configured"),
-        ("portMappings" in container, "Port mappings defined"),
+        (lambda: "name" in container, "Container name defined"),
+        (lambda: "image" in container, "Container image defined"),
+        (lambda: "resourceRequirements" in container, "Resource requirements defined"),
+        (lambda: "logConfiguration" in container, "Log configuration defined"),
+        (lambda: "healthCheck" in container, "Health check configured"),
+        (lambda: "portMappings" in container, "Port mappings defined"),
     ]
     
     for condition, description in container_checks:
-        if condition:
-            print(f"{GREEN}✓ {description}{RESET}")
+        if condition():
+            print(OK.format(description))
         else:
-            print(f"{RED}✗ {description}{RESET}")
+            print(FAIL.format(description))
             return False
     
     # Check GPU configuration
@@ -124,35 +286,34 @@ def validate_ecs_task_definition() -> bool:
     has_gpu = any(req.get("type") == "GPU" for req in resource_reqs)
     
     if has_gpu:
-        print(f"{GREEN}✓ GPU resource requirement configured{RESET}")
+        print(OK.format("GPU resource requirement configured"))
     else:
-        print(f"{RED}✗ GPU resource requirement not found{RESET}")
+        print(FAIL.format("GPU resource requirement not found"))
         return False
     
     # Check log configuration
     log_config = container.get("logConfiguration", {})
     if log_config.get("logDriver") == "awslogs":
-        print(f"{GREEN}✓ CloudWatch Logs configured (awslogs){RESET}")
+        print(OK.format("CloudWatch Logs configured (awslogs)"))
     else:
-        print(f"{RED}✗ CloudWatch Logs not properly configured{RESET}")
+        print(FAIL.format("CloudWatch Logs not properly configured"))
         return False
     
-    # Check environment variables
-    env_vars = {env["name"]: env["value"] for env in container.get("environment", [])}
+    # Check environment variables (only the names matter here)
+    env_names = {env["name"] for env in container.get("environment", ())}
     
     required_env_vars = ["AWS_REGION", "LOG_LEVEL", "HTTP_PORT"]
     for var in required_env_vars:
-        if var in env_vars:
-            print(f"{GREEN}✓ Environment variable '{var}' defined{RESET}")
+        if var in env_names:
+            print(OK.format(f"Environment variable '{var}' defined"))
         else:
-            print(f"{YELLOW}⚠ Environment variable '{var}' not found (may use placeholder){RESET}")
+            print(WARN.format(f"Environment variable '{var}' not found (may use placeholder)"))
     
     # Check port 8080
-    ports = [pm.get("containerPort") for pm in container.get("portMappings", [])]
-    if 8080 in ports:
-        print(f"{GREEN}✓ Port 8080 exposed{RESET}")
+    if any(pm.get("containerPort") == 8080 for pm in container.get("portMappings", ())):
+        print(OK.format("Port 8080 exposed"))
     else:
-        print(f"{RED}✗ Port 8080 not exposed{RESET}")
+        print(FAIL.format("Port 8080 not exposed"))
         return False
     
     return True
@@ -165,20 +326,17 @@ def validate_ecs_service_definition() -> bool:
     service_def_file = Path("deployment/ecs/ecs-service.json")
     
     if not service_def_file.exists():
-        print(f"{RED}✗ Service definition not found: {service_def_file}{RESET}")
+        print(FAIL.format(f"Service definition not found: {service_def_file}"))
         return False
     
-    print(f"{GREEN}✓ Service definition file exists{RESET}")
+    print(OK.format("Service definition file exists"))
     
-    # Validate JSON syntax
-    if not validate_json_file(service_def_file, ["serviceName", "cluster", "taskDefinition"]):
+    # Validate JSON syntax and load content in one parse
+    service_def = load_and_validate_json(service_def_file, REQUIRED_SERVICE_KEYS)
+    if service_def is None:
         return False
     
-    print(f"{GREEN}✓ JSON syntax valid{RESET}")
-    
-    # Load and validate content
-    with open(service_def_file, 'r') as f:
-        service_def = json.load(f)
+    print(OK.format("JSON syntax valid"))
     
     # Check required fields
     checks = [
@@ -192,9 +350,9 @@ def validate_ecs_service_definition() -> bool:
     
     for condition, description in checks:
         if condition:
-            print(f"{GREEN}✓ {description}{RESET}")
+            print(OK.format(f"{description}"))
         else:
-            print(f"{RED}✗ {description}{RESET}")
+            print(FAIL.format(f"{description}"))
             return False
     
     # Check network configuration
@@ -208,24 +366,24 @@ def validate_ecs_service_definition() -> bool:
     
     for condition, description in net_checks:
         if condition:
-            print(f"{GREEN}✓ {description}{RESET}")
+            print(OK.format(f"{description}"))
         else:
-            print(f"{RED}✗ {description}{RESET}")
+            print(FAIL.format(f"{description}"))
             return False
     
     # Check that public IP is disabled (private subnets)
     if net_config.get("assignPublicIp") == "DISABLED":
-        print(f"{GREEN}✓ Public IP assignment disabled (private subnets){RESET}")
+        print(OK.format("Public IP assignment disabled (private subnets)"))
     else:
-        print(f"{YELLOW}⚠ Public IP assignment not disabled{RESET}")
+        print(WARN.format("Public IP assignment not disabled"))
     
     # Check deployment configuration
     if "deploymentConfiguration" in service_def:
-        print(f"{GREEN}✓ Deployment configuration present{RESET}")
+        print(OK.format("Deployment configuration present"))
         
         deploy_config = service_def["deploymentConfiguration"]
         if "deploymentCircuitBreaker" in deploy_config:
-            print(f"{GREEN}✓ Deployment circuit breaker configured{RESET}")
+            print(OK.format("Deployment circuit breaker configured"))
     
     return True
 
@@ -237,39 +395,42 @@ def validate_iam_task_role() -> bool:
     task_role_file = Path("deployment/ecs/iam-task-role.json")
     
     if not task_role_file.exists():
-        print(f"{RED}✗ Task role policy not found: {task_role_file}{RESET}")
+        print(FAIL.format(f"Task role policy not found: {task_role_file}"))
         return False
     
-    print(f"{GREEN}✓ Task role policy file exists{RESET}")
+    print(OK.format("Task role policy file exists"))
     
-    # Validate JSON syntax
-    if not validate_json_file(task_role_file, ["Version", "Statement"]):
+    # Validate JSON syntax and load content in one parse
+    policy = load_and_validate_json(task_role_file, REQUIRED_POLICY_KEYS)
+    if policy is None:
         return False
     
-    print(f"{GREEN}✓ JSON syntax valid{RESET}")
-    
-    # Load and validate content
-    with open(task_role_file, 'r') as f:
-        policy = json.load(f)
+    print(OK.format("JSON syntax valid"))
     
     # Check policy structure
     if "Statement" not in policy or not isinstance(policy["Statement"], list):
-        print(f"{RED}✗ Invalid policy structure{RESET}")
+        print(FAIL.format("Invalid policy structure"))
         return False
     
-    print(f"{GREEN}✓ Policy structure valid{RESET}")
+    print(OK.format("Policy structure valid"))
     
     # Check for required service permissions
     statements = policy["Statement"]
     
-    # Extract actions from all statements
-    all_actions = []
+    # One pass over the statements drives all accumulators: the full-action
+    # set, the service -> verbs map, and the resource/condition flags
+    actions_set = set()
+    by_service = defaultdict(set)
+    has_resource_restrictions = False
+    has_conditions = False
     for stmt in statements:
-        actions = stmt.get("Action", [])
-        if isinstance(actions, str):
-            all_actions.append(actions)
-        else:
-            all_actions.extend(actions)
+        actions = stmt.get("Action", ())
+        for action in (actions,) if isinstance(actions, str) else actions:
+            actions_set.add(action)
+            service, _, verb = action.partition(":")
+            by_service[service].add(verb)
+        has_resource_restrictions |= "Resource" in stmt and stmt["Resource"] != "*"
+        has_conditions |= "Condition" in stmt
     
     required_services = {
         "kinesisvideo": ["kinesisvideo:DescribeStream", "kinesisvideo:GetDataEndpoint", "kinesisvideo:GetMedia"],
@@ -280,38 +441,30 @@ def validate_iam_task_role() -> bool:
     }
     
     for service, required_actions in required_services.items():
-        service_actions = [a for a in all_actions if a.startswith(f"{service}:")]
-        
-        if service_actions:
-            print(f"{GREEN}✓ {service.upper()} permissions defined{RESET}")
+        if service in by_service:
+            print(OK.format(f"{service.upper()} permissions defined"))
             
             # Check for specific actions
             for action in required_actions:
-                if action in all_actions or any(action.split(':')[1] in a for a in service_actions):
-                    print(f"  {GREEN}✓ {action}{RESET}")
+                verb = action.partition(":")[2]
+                if action in actions_set or verb in by_service[service]:
+                    print("  " + OK.format(f"{action}"))
                 else:
-                    print(f"  {YELLOW}⚠ {action} not explicitly found{RESET}")
+                    print("  " + WARN.format(f"{action} not explicitly found"))
         else:
-            print(f"{YELLOW}⚠ No {service.upper()} permissions found{RESET}")
+            print(WARN.format(f"No {service.upper()} permissions found"))
     
     # Check for resource restrictions
-    has_resource_restrictions = any(
-        "Resource" in stmt and stmt["Resource"] != "*"
-        for stmt in statements
-    )
-    
     if has_resource_restrictions:
-        print(f"{GREEN}✓ Resource-level restrictions present (least-privilege){RESET}")
+        print(OK.format("Resource-level restrictions present (least-privilege)"))
     else:
-        print(f"{YELLOW}⚠ No resource-level restrictions found{RESET}")
+        print(WARN.format("No resource-level restrictions found"))
     
     # Check for condition restrictions
-    has_conditions = any("Condition" in stmt for stmt in statements)
-    
     if has_conditions:
-        print(f"{GREEN}✓ Conditional access controls present{RESET}")
+        print(OK.format("Conditional access controls present"))
     else:
-        print(f"{YELLOW}⚠ No conditional access controls found{RESET}")
+        print(WARN.format("No conditional access controls found"))
     
     return True
 
@@ -323,30 +476,26 @@ def validate_iam_execution_role() -> bool:
     exec_role_file = Path("deployment/ecs/iam-execution-role.json")
     
     if not exec_role_file.exists():
-        print(f"{RED}✗ Execution role policy not found: {exec_role_file}{RESET}")
+        print(FAIL.format(f"Execution role policy not found: {exec_role_file}"))
         return False
     
-    print(f"{GREEN}✓ Execution role policy file exists{RESET}")
+    print(OK.format("Execution role policy file exists"))
     
-    # Validate JSON syntax
-    if not validate_json_file(exec_role_file, ["Version", "Statement"]):
+    # Validate JSON syntax and load content in one parse
+    policy = load_and_validate_json(exec_role_file, REQUIRED_POLICY_KEYS)
+    if policy is None:
         return False
     
-    print(f"{GREEN}✓ JSON syntax valid{RESET}")
+    print(OK.format("JSON syntax valid"))
     
-    # Load and validate content
-    with open(exec_role_file, 'r') as f:
-        policy = json.load(f)
-    
-    # Extract actions
+    # Extract actions into the same O(1) indexes as the task role check
     statements = policy["Statement"]
-    all_actions = []
-    for stmt in statements:
-        actions = stmt.get("Action", [])
-        if isinstance(actions, str):
-            all_actions.append(actions)
-        else:
-            all_actions.extend(actions)
+    actions_set = set()
+    by_service = defaultdict(set)
+    for action in iter_actions(statements):
+        actions_set.add(action)
+        service, _, verb = action.partition(":")
+        by_service[service].add(verb)
     
     # Check required actions
     required_permissions = [
@@ -357,10 +506,11 @@ def validate_iam_execution_role() -> bool:
     ]
     
     for action in required_permissions:
-        if action in all_actions or any(action.split(':')[1] in a for a in all_actions):
-            print(f"{GREEN}✓ {action}{RESET}")
+        service, _, verb = action.partition(":")
+        if action in actions_set or verb in by_service[service]:
+            print(OK.format(f"{action}"))
         else:
-            print(f"{RED}✗ {action} not found{RESET}")
+            print(FAIL.format(f"{action} not found"))
             return False
     
     return True
@@ -373,55 +523,36 @@ def validate_readme() -> bool:
     readme_file = Path("deployment/ecs/README-ECS.md")
     
     if not readme_file.exists():
-        print(f"{RED}✗ README-ECS.md not found{RESET}")
+        print(FAIL.format("README-ECS.md not found"))
         return False
     
-    print(f"{GREEN}✓ README-ECS.md exists{RESET}")
-    
-    content = readme_file.read_text()
-    
-    # Check required sections
-    required_sections = [
-        "Prerequisites",
-        "Architecture",
-        "Step-by-Step",
-        "ECR",
-        "IAM",
-        "Task Definition",
-        "Service",
-        "Container Insights",
-        "VPC Endpoints",
-        "KVS",
-        "Troubleshooting",
-    ]
+    print(OK.format("README-ECS.md exists"))
     
-    for section in required_sections:
-        if section.lower() in content.lower():
-            print(f"{GREEN}✓ Section '{section}' found{RESET}")
+    content = read_text_cached(readme_file)
+
+    # Check required sections: one case-insensitive scan instead of
+    # re-lowercasing the whole README per section
+    found_sections = {m.lower() for m in _README_SECTION_RE.findall(content)}
+    for section in README_SECTIONS:
+        if section.lower() in found_sections:
+            print(OK.format(f"Section '{section}' found"))
         else:
-            print(f"{YELLOW}⚠ Section '{section}' not found{RESET}")
-    
-    # Check for important notes
-    important_notes = [
-        "NAT Gateway",
-        "g4dn",
-        "GPU",
-        "CUDA",
-        "VPC endpoint",
-    ]
-    
-    for note in important_notes:
-        if note in content:
-            print(f"{GREEN}✓ Mentions '{note}'{RESET}")
+            print(WARN.format(f"Section '{section}' not found"))
+
+    # Check for important notes (case-sensitive, same single-pass idea)
+    found_notes = set(_README_NOTE_RE.findall(content))
+    for note in README_NOTES:
+        if note in found_notes:
+            print(OK.format(f"Mentions '{note}'"))
         else:
-            print(f"{YELLOW}⚠ '{note}' not mentioned{RESET}")
+            print(WARN.format(f"'{note}' not mentioned"))
     
     # Check line count
     lines = content.count('\n')
     if lines > 500:
-        print(f"{GREEN}✓ README is comprehensive ({lines} lines){RESET}")
+        print(OK.format(f"README is comprehensive ({lines} lines)"))
     else:
-        print(f"{YELLOW}⚠ README may be incomplete ({lines} lines){RESET}")
+        print(WARN.format(f"README may be incomplete ({lines} lines)"))
     
     return True
 
@@ -432,43 +563,37 @@ def validate_deployment_script() -> bool:
     
     deploy_script = Path("deployment/ecs/deploy.sh")
     
-    if not deploy_script.exists():
-        print(f"{RED}✗ deploy.sh not found{RESET}")
+    # One lstat answers both existence and the executable-bit check below
+    try:
+        st = os.lstat(deploy_script)
+    except FileNotFoundError:
+        print(FAIL.format("deploy.sh not found"))
         return False
     
-    print(f"{GREEN}✓ deploy.sh exists{RESET}")
+    print(OK.format("deploy.sh exists"))
     
     # Check if executable
-    if os.access(deploy_script, os.X_OK):
-        print(f"{GREEN}✓ Script is executable{RESET}")
+    if st.st_mode & 0o111:
+        print(OK.format("Script is executable"))
     else:
-        print(f"{YELLOW}⚠ Script is not executable (run: chmod +x deploy.sh){RESET}")
-    
-    content = deploy_script.read_text()
-    
-    # Check for required functions
-    required_functions = [
-        "create_ecr_repo",
-        "build_and_push_image",
-        "create_iam_roles",
-        "create_ecs_cluster",
-        "register_task_definition",
-        "create_security_group",
-        "create_ecs_service",
-    ]
+        print(WARN.format("Script is not executable (run: chmod +x deploy.sh)"))
+    
+    content = read_text_cached(deploy_script)
     
-    for func in required_functions:
-        if func in content:
-            print(f"{GREEN}✓ Function '{func}' defined{RESET}")
+    # Check for required functions: one DFA pass instead of a scan per name
+    found_funcs = set(_DEPLOY_FUNC_RE.findall(content))
+    for func in DEPLOY_FUNCTIONS:
+        if func in found_funcs:
+            print(OK.format(f"Function '{func}' defined"))
         else:
-            print(f"{RED}✗ Function '{func}' not found{RESET}")
+            print(FAIL.format(f"Function '{func}' not found"))
             return False
     
     # Check for error handling
     if "set -e" in content:
-        print(f"{GREEN}✓ Error handling enabled (set -e){RESET}")
+        print(OK.format("Error handling enabled (set -e)"))
     else:
-        print(f"{YELLOW}⚠ Error handling not enabled{RESET}")
+        print(WARN.format("Error handling not enabled"))
     
     return True
 
@@ -480,40 +605,53 @@ def validate_env_example() -> bool:
     env_file = Path("deployment/ecs/.env.example")
     
     if not env_file.exists():
-        print(f"{RED}✗ .env.example not found{RESET}")
+        print(FAIL.format(".env.example not found"))
         return False
     
-    print(f"{GREEN}✓ .env.example exists{RESET}")
-    
-    content = env_file.read_text()
-    
-    # Check required variables
-    required_vars = [
-        "AWS_REGION",
-        "AWS_ACCOUNT_ID",
-        "ECR_REPO_NAME",
-        "ECS_CLUSTER_NAME",
-        "VPC_ID",
-        "PRIVATE_SUBNET_1",
-        "PRIVATE_SUBNET_2",
-        "KVS_STREAM_PREFIX",
-        "KDS_STREAM_NAME",
-        "S3_BUCKET_NAME",
-        "S3_PREFIX",
-    ]
+    print(OK.format(".env.example exists"))
+    
+    content = read_text_cached(env_file)
     
-    for var in required_vars:
-        if var in content:
-            print(f"{GREEN}✓ Variable '{var}' documented{RESET}")
+    # Check required variables in one alternation pass
+    found_vars = set(_ENV_VAR_RE.findall(content))
+    for var in ENV_REQUIRED_VARS:
+        if var in found_vars:
+            print(OK.format(f"Variable '{var}' documented"))
         else:
-            print(f"{RED}✗ Variable '{var}' not found{RESET}")
+            print(FAIL.format(f"Variable '{var}' not found"))
             return False
     
     return True
 
 
+# Fail-fast ordering: cheapest, most-informative gates first so an abort
+# costs as little as possible; the heavy README scan goes last.
+_FAIL_FAST_ORDER = (
+    ".env.example",
+    "Deployment Script",
+    "ECS Task Definition",
+    "ECS Service Definition",
+    "IAM Task Role Policy",
+    "IAM Execution Role Policy",
+    "README-ECS.md",
+)
+
+
 def main():
     """Run all validation checks."""
+    parser = argparse.ArgumentParser(description="Validate step 9 artifacts")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first failing check (implies --serial)",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="run checks sequentially instead of in a thread pool",
+    )
+    args = parser.parse_args()
+
     print_header("Step 9: ECS (EC2 GPU) Deployment Validation")
     
     checks = [
@@ -526,19 +664,59 @@ def main():
         (".env.example", validate_env_example),
     ]
     
+    if args.fail_fast:
+        rank = {name: i for i, name in enumerate(_FAIL_FAST_ORDER)}
+        checks.sort(key=lambda check: rank.get(check[0], len(rank)))
+
     results = []
-    
-    for name, check_func in checks:
+
+    if args.fail_fast or args.serial:
+        for name, check_func in checks:
+            try:
+                passed = check_func()
+            except Exception as e:
+                print(f"\n{RED}✗ {name} raised exception: {e}{RESET}")
+                traceback.print_exc()
+                passed = False
+            results.append((name, passed))
+            if args.fail_fast and not passed:
+                break
+        return summarize(results)
+
+    # The validators touch disjoint files and are I/O-bound, so run them
+    # concurrently. sys.stdout is swapped for a thread-local proxy while the
+    # pool runs so each check's prints land in its own buffer; buffers are
+    # replayed in submission order to keep the report deterministic.
+    def run_check(name, check_func):
+        buf = io.StringIO()
+        _STDOUT_PROXY.push(buf)
         try:
             passed = check_func()
-            results.append((name, passed))
         except Exception as e:
-            print(f"\n{RED}✗ {name} raised exception: {e}{RESET}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
-    
-    # Summary
+            buf.write(f"\n{RED}✗ {name} raised exception: {e}{RESET}\n")
+            buf.write(traceback.format_exc())
+            passed = False
+        finally:
+            _STDOUT_PROXY.pop()
+        return passed, buf.getvalue()
+
+    real_stdout = sys.stdout
+    sys.stdout = _STDOUT_PROXY
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [pool.submit(run_check, name, func) for name, func in checks]
+            for (name, _), future in zip(checks, futures):
+                passed, output = future.result()
+                real_stdout.write(output)
+                results.append((name, passed))
+    finally:
+        sys.stdout = real_stdout
+    
+    return summarize(results)
+
+
+def summarize(results) -> int:
+    """Print the summary block and return the process exit code."""
     print_header("Validation Summary")
     
     passed_count = sum(1 for _, passed in results if passed)
@@ -551,11 +729,11 @@ def main():
     print(f"\n{BLUE}{'='*80}{RESET}")
     
     if passed_count == total_count:
-        print(f"{GREEN}✓ All checks passed ({passed_count}/{total_count}){RESET}")
+        print(OK.format(f"All checks passed ({passed_count}/{total_count})"))
         print(f"{GREEN}Step 9 implementation is complete and valid!{RESET}")
         return 0
     else:
-        print(f"{RED}✗ Some checks failed ({passed_count}/{total_count}){RESET}")
+        print(FAIL.format(f"Some checks failed ({passed_count}/{total_count})"))
         print(f"{RED}Please review the failures above.{RESET}")
         return 1
 